@@ -1,12 +1,23 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
-from app.db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_async_db
 from app.schemas.user import SignupRequest, LoginRequest, LoginResponse, ErrorResponse
-from app.crud import get_user_by_email, create_user
-from app.core.security import verify_password, create_access_token
+from app.crud import aio as crud_async
+from app.core.security import (
+    verify_password_async, get_password_hash_async, create_access_token, revoke_token,
+    PasswordHasherBusy, PASSWORD_HASH_RETRY_AFTER
+)
+from app.auth import get_token_payload
 
 router = APIRouter()
 
+def password_hasher_busy_exception():
+    return HTTPException(
+        status_code=503,
+        detail="요청이 많아 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER)}
+    )
+
 @router.post("/signup", 
              status_code=201,
              summary="User registration",
@@ -14,22 +25,28 @@ router = APIRouter()
              responses={
                  201: {"description": "User successfully created"},
                  400: {"model": ErrorResponse, "description": "Bad request - invalid payload format"},
-                 500: {"model": ErrorResponse, "description": "Internal server error"}
+                 500: {"model": ErrorResponse, "description": "Internal server error"},
+                 503: {"model": ErrorResponse, "description": "Password hashing pool is saturated"}
              })
-async def signup(user_data: SignupRequest, db: Session = Depends(get_db)):
+async def signup(user_data: SignupRequest, db: AsyncSession = Depends(get_async_db)):
     try:
         # 이메일 중복 확인
-        existing_user = get_user_by_email(db, user_data.email)
+        existing_user = await crud_async.get_user_by_email(db, user_data.email)
         if existing_user:
             raise HTTPException(
                 status_code=400,
                 detail="이미 등록된 이메일입니다"
             )
         
+        # 비밀번호 해싱은 전용 스레드 풀에서 수행
+        hashed_password = await get_password_hash_async(user_data.password)
+        
         # 사용자 생성
-        user = create_user(db, user_data)
+        user = await crud_async.create_user(db, user_data, hashed_password)
         return {"message": "사용자가 성공적으로 생성되었습니다"}
     
+    except PasswordHasherBusy:
+        raise password_hasher_busy_exception()
     except HTTPException:
         raise
     except Exception as e:
@@ -46,13 +63,14 @@ async def signup(user_data: SignupRequest, db: Session = Depends(get_db)):
                  200: {"model": LoginResponse, "description": "Login successful"},
                  400: {"model": ErrorResponse, "description": "Bad request - invalid payload format"},
                  401: {"model": ErrorResponse, "description": "Unauthorized - login failed"},
-                 500: {"model": ErrorResponse, "description": "Internal server error"}
+                 500: {"model": ErrorResponse, "description": "Internal server error"},
+                 503: {"model": ErrorResponse, "description": "Password hashing pool is saturated"}
              })
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     try:
         # 사용자 찾기
-        user = get_user_by_email(db, login_data.email)
-        if not user or not verify_password(login_data.password, user.password_hash):
+        user = await crud_async.get_user_by_email(db, login_data.email)
+        if not user or not await verify_password_async(login_data.password, user.password_hash):
             raise HTTPException(
                 status_code=401,
                 detail="이메일 또는 비밀번호가 올바르지 않습니다"
@@ -68,10 +86,24 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
         
         return LoginResponse(token=token)
     
+    except PasswordHasherBusy:
+        raise password_hasher_busy_exception()
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail="서버 내부 오류가 발생했습니다"
-        )
\ No newline at end of file
+        )
+
+@router.post("/logout",
+             summary="User logout",
+             description="Revoke the current JWT token",
+             responses={
+                 200: {"description": "Logout successful"},
+                 401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"}
+             })
+async def logout(payload: dict = Depends(get_token_payload)):
+    # 현재 토큰을 만료 시각까지 폐기 목록에 등록
+    await revoke_token(payload)
+    return {"message": "로그아웃되었습니다"}
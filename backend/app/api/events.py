@@ -0,0 +1,86 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from app.auth import get_stream_principal, get_stream_token_payload, get_token_payload, Principal
+from app.core.security import create_stream_ticket, is_token_revoked, EVENT_TICKET_SECONDS
+from app.events import get_event_broker, user_channel
+from app.schemas.user import StreamTicketResponse, ErrorResponse
+import json
+import os
+import time
+
+router = APIRouter()
+
+# 이벤트가 없을 때 연결 유지용 주석 전송 간격 (프록시 유휴 타임아웃보다 짧게)
+EVENT_HEARTBEAT_SECONDS = float(os.getenv("EVENT_HEARTBEAT_SECONDS", "15"))
+# 연결이 끊겼을 때 브라우저 EventSource 의 재연결 대기 시간 (ms)
+EVENT_RETRY_MS = int(os.getenv("EVENT_RETRY_MS", "3000"))
+
+def format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+
+@router.post("/events/ticket",
+            response_model=StreamTicketResponse,
+            summary="Issue event stream ticket",
+            description=(
+                "Issue a short-lived, single-use ticket for GET /api/events?ticket= "
+                "(EventSource cannot send the Authorization header)."
+            ),
+            responses={
+                200: {"model": StreamTicketResponse, "description": "Ticket issued"},
+                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"}
+            })
+async def issue_stream_ticket(payload: dict = Depends(get_token_payload)):
+    return StreamTicketResponse(ticket=create_stream_ticket(payload), expiresIn=EVENT_TICKET_SECONDS)
+
+@router.get("/events",
+           summary="Match request event stream",
+           description=(
+               "Server-Sent Events stream of match request status changes for the current user. "
+               "Authenticate with the Authorization header or ?ticket= from POST /api/events/ticket (EventSource). "
+               "The stream ends with 'revoked' after logout and 'expired' when the access token expires. "
+               "On 'ready' and 'resync' events, fetch the feeds once with updatedSince to catch up."
+           ))
+async def stream_events(
+    request: Request,
+    current_user: Principal = Depends(get_stream_principal),
+    payload: dict = Depends(get_stream_token_payload)
+):
+    broker = get_event_broker()
+    expires_at = payload.get("exp")
+
+    async def event_stream():
+        async with broker.subscribe(user_channel(current_user.id)) as subscription:
+            yield f"retry: {EVENT_RETRY_MS}\n\n"
+            # 구독 후 전송 - 클라이언트는 이 시점 이후 변경을 놓치지 않음
+            yield format_sse("ready", {"userId": current_user.id})
+
+            while not await request.is_disconnected():
+                # 연결 후 로그아웃(토큰 폐기)해도 스트림이 남지 않도록 하트비트마다 다시 확인
+                if await is_token_revoked(payload):
+                    yield format_sse("revoked", {})
+                    break
+
+                # 토큰이 만료되면 스트림 종료 (클라이언트는 새 토큰으로 재연결)
+                timeout = EVENT_HEARTBEAT_SECONDS
+                if expires_at is not None:
+                    remaining = expires_at - time.time()
+                    if remaining <= 0:
+                        yield format_sse("expired", {})
+                        break
+                    timeout = min(timeout, remaining)
+
+                event = await subscription.get(timeout)
+                if event is None:
+                    yield ": ping\n\n"
+                else:
+                    yield format_sse(event["type"], event)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx 등 리버스 프록시의 응답 버퍼링 끄기
+            "X-Accel-Buffering": "no",
+        }
+    )
@@ -1,25 +1,57 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from sqlalchemy.orm import Session
-from app.db.database import get_db
-from app.schemas.user import MentorListItem, MentorProfileDetails, MatchRequestCreate, MatchRequest, MatchRequestOutgoing
-from app.auth import get_current_user
-from app.models.user import User, MatchRequest as MatchRequestModel
-from app.crud import (
-    get_mentors, create_match_request, get_incoming_match_requests, 
-    get_outgoing_match_requests, accept_match_request, reject_match_request, 
-    cancel_match_request, get_match_request_by_id, get_user_by_id
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Header, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.db.database import get_async_db
+from app.schemas.user import (
+    MentorListItem, MentorListPage, MentorProfileDetails, MentorRecommendation, MatchRequestCreate, MatchRequest,
+    MatchRequestWithCounterpart, MatchRequestOutgoingWithCounterpart, MatchRequestPage, MatchRequestOutgoingPage,
+    MatchRequestBatchRequest, MatchRequestBatchResponse, MatchRequestBatchResult
 )
-from typing import Optional, List
-from sqlalchemy import and_
+from app.auth import get_current_principal, get_read_db, Principal
+from app.api.profile import profile_image_url, etag_matches, to_user_summary
+from app.models.user import User
+from app.crud import aio as crud_async, parse_skill_filter
+from app.core.directory import mentor_directory, MentorEntry
+from app.core.recommend import mentor_recommender
+from app.core.pagination import MAX_PAGE_SIZE, DEFAULT_PAGE_SIZE
+from datetime import datetime
+from functools import partial
+from typing import Optional, List, Union
+import os
 
 router = APIRouter()
 
-@router.get("/mentors", response_model=List[MentorListItem])
+# 피드 asOf 를 DB 시계보다 앞당기는 폭(초) - 복제 지연과 쓰기 트랜잭션 길이보다 길게
+MATCH_REQUEST_FEED_OVERLAP_SECONDS = float(os.getenv("MATCH_REQUEST_FEED_OVERLAP_SECONDS", "30"))
+
+def to_mentor_list_item(mentor: Union[User, MentorEntry]) -> MentorListItem:
+    profile = MentorProfileDetails(
+        name=mentor.name,
+        bio=mentor.bio or "",
+        imageUrl=profile_image_url("mentor", mentor.id, mentor.image_hash),
+        skills=mentor.skills or []
+    )
+    return MentorListItem(
+        id=mentor.id,
+        email=mentor.email,
+        role="mentor",
+        profile=profile
+    )
+
+@router.get("/mentors", response_model=Union[List[MentorListItem], MentorListPage])
 async def get_mentors_list(
-    skill: Optional[str] = Query(None),
+    response: Response,
+    skill: Optional[str] = Query(None, description="스킬 필터 (쉼표로 여러 개 지정 가능)"),
+    skill_match: str = Query("any", regex="^(any|all)$", description="여러 스킬 지정 시 any(OR) 또는 all(AND)"),
+    q: Optional[str] = Query(None, max_length=200, description="이름/소개/스킬 전문 검색어 (관련도 순 정렬)"),
     order_by: Optional[str] = Query(None, regex="^(skill|name)$"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    available: Optional[bool] = Query(None, description="true 면 수락된 요청이 없는(매칭 가능한) 멘토만, false 면 이미 매칭된 멘토만"),
+    sort: Optional[str] = Query(None, regex="^least_busy$", description="least_busy: 대기 중인 요청이 적은 멘토 순"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 페이지 응답 반환)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         # 멘티만 접근 가능
@@ -29,25 +61,104 @@ async def get_mentors_list(
                 detail="멘티만 멘토 목록에 접근할 수 있습니다"
             )
         
-        mentors = get_mentors(db, skill=skill, order_by=order_by)
+        match_all = skill_match == "all"
         
-        mentor_list = []
-        for mentor in mentors:
-            profile = MentorProfileDetails(
-                name=mentor.name,
-                bio=mentor.bio or "",
-                imageUrl=f"/images/mentor/{mentor.id}",
-                skills=mentor.skills or []
+        # 메모리 스냅샷에서 응답 (버전이 그대로면 304)
+        # 전문 검색은 DB 검색 인덱스, 요청 수에 따른 필터/정렬은 DB 의 비정규화 컬럼 인덱스 사용
+        if mentor_directory.enabled and q is None and available is None and sort is None:
+            snapshot = await mentor_directory.get(partial(crud_async.get_mentor_directory_rows, db))
+            headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+            if if_none_match and etag_matches(if_none_match, snapshot.etag):
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
+            
+            skills = parse_skill_filter(skill)
+            if limit is None and cursor is None:
+                mentors = snapshot.mentors(skills, match_all=match_all, order_by=order_by)
+                return [to_mentor_list_item(mentor) for mentor in mentors]
+            
+            mentors, next_cursor = snapshot.page(skills, match_all, order_by, limit or DEFAULT_PAGE_SIZE, cursor)
+            return MentorListPage(
+                items=[to_mentor_list_item(mentor) for mentor in mentors],
+                nextCursor=next_cursor
             )
-            mentor_item = MentorListItem(
-                id=mentor.id,
-                email=mentor.email,
-                role="mentor",
-                profile=profile
+        
+        # limit/cursor 가 없으면 기존과 같이 전체 목록 반환
+        if limit is None and cursor is None:
+            mentors = await crud_async.get_mentors(
+                db, skill=skill, order_by=order_by, match_all=match_all, q=q, available=available, sort=sort
             )
-            mentor_list.append(mentor_item)
+            return [to_mentor_list_item(mentor) for mentor in mentors]
         
-        return mentor_list
+        mentors, next_cursor = await crud_async.get_mentors_page(
+            db,
+            skill=skill,
+            order_by=order_by,
+            match_all=match_all,
+            limit=limit or DEFAULT_PAGE_SIZE,
+            cursor=cursor,
+            q=q,
+            available=available,
+            sort=sort
+        )
+        return MentorListPage(
+            items=[to_mentor_list_item(mentor) for mentor in mentors],
+            nextCursor=next_cursor
+        )
+    
+    except ValueError as e:
+        # 잘못된 커서, 지원하지 않는 정렬(조합) 또는 빈 검색어
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error"
+        )
+
+@router.get("/mentors/recommended", response_model=List[MentorRecommendation])
+async def get_recommended_mentors(
+    skills: Optional[str] = Query(None, description="관심 스킬 (쉼표로 여러 개 지정 가능)"),
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
+):
+    try:
+        # 멘티만 접근 가능
+        if current_user.role != "mentee":
+            raise HTTPException(
+                status_code=403,
+                detail="멘티만 멘토 추천을 받을 수 있습니다"
+            )
+        
+        # 추천 행렬이 없거나 TTL 이 지났으면 DB 에서 전체를 다시 읽음
+        matrix = await mentor_recommender.get(partial(crud_async.get_mentor_recommendation_source, db))
+        
+        wanted = parse_skill_filter(skills)
+        ranked = await run_in_threadpool(mentor_recommender.recommend, matrix, wanted, limit)
+        
+        # 상위 k 명의 프로필만 한 번의 IN 쿼리로 조회
+        mentor_ids = [mentor_id for mentor_id, _, _ in ranked]
+        mentors = {mentor.id: mentor for mentor in await crud_async.get_mentors_by_ids(db, mentor_ids)}
+        wanted_set = set(wanted)
+        
+        results = []
+        for mentor_id, score, available in ranked:
+            mentor = mentors.get(mentor_id)
+            if mentor is None:
+                continue
+            item = to_mentor_list_item(mentor)
+            results.append(MentorRecommendation(
+                **item.model_dump(),
+                score=score,
+                matchedSkills=[skill for skill in dict.fromkeys(mentor.skills or []) if skill in wanted_set],
+                available=available
+            ))
+        return results
     
     except HTTPException:
         raise
@@ -60,8 +171,8 @@ async def get_mentors_list(
 @router.post("/match-requests", response_model=MatchRequest)
 async def create_match_request_endpoint(
     request_data: MatchRequestCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         # 멘티만 접근 가능
@@ -78,49 +189,8 @@ async def create_match_request_endpoint(
                 detail="본인만 요청을 보낼 수 있습니다"
             )
         
-        # 멘토가 존재하는지 확인
-        mentor = get_user_by_id(db, request_data.mentorId)
-        if not mentor or mentor.role != "mentor":
-            raise HTTPException(
-                status_code=400,
-                detail="멘토를 찾을 수 없습니다"
-            )
-        
-        # 매칭 요청 생성
-        match_request = create_match_request(db, request_data)
-        if not match_request:
-            # 더 구체적인 에러 메시지 제공
-            existing_pending = db.query(MatchRequestModel).filter(
-                and_(
-                    MatchRequestModel.mentee_id == request_data.menteeId,
-                    MatchRequestModel.status == "pending"
-                )
-            ).first()
-            
-            if existing_pending:
-                raise HTTPException(
-                    status_code=400,
-                    detail="이미 대기 중인 요청이 있습니다. 응답을 받거나 취소한 후 새로운 요청을 보내주세요."
-                )
-            
-            existing_to_same_mentor = db.query(MatchRequestModel).filter(
-                and_(
-                    MatchRequestModel.mentor_id == request_data.mentorId,
-                    MatchRequestModel.mentee_id == request_data.menteeId,
-                    MatchRequestModel.status == "pending"
-                )
-            ).first()
-            
-            if existing_to_same_mentor:
-                raise HTTPException(
-                    status_code=400,
-                    detail="이미 해당 멘토에게 대기 중인 요청이 있습니다."
-                )
-            
-            raise HTTPException(
-                status_code=400,
-                detail="매칭 요청을 생성할 수 없습니다"
-            )
+        # 매칭 요청 생성 (멘토 확인과 중복 pending 확인을 DB 가 한 문장으로 처리)
+        match_request = await crud_async.create_match_request(db, request_data)
         
         return MatchRequest(
             id=match_request.id,
@@ -130,6 +200,12 @@ async def create_match_request_endpoint(
             status=match_request.status
         )
     
+    except ValueError as e:
+        # 멘토/멘티 없음 또는 이미 대기 중인 요청 있음
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -138,10 +214,41 @@ async def create_match_request_endpoint(
             detail="Internal server error"
         )
 
-@router.get("/match-requests/incoming", response_model=List[MatchRequest])
+def to_match_request(req, counterpart=None) -> MatchRequestWithCounterpart:
+    fields = dict(
+        id=req.id,
+        mentorId=req.mentor_id,
+        menteeId=req.mentee_id,
+        message=req.message,
+        status=req.status
+    )
+    # 요청하지 않았으면 counterpart 필드 자체를 응답에서 제외 (response_model_exclude_unset)
+    if counterpart is not None:
+        fields["counterpart"] = to_user_summary(counterpart)
+    return MatchRequestWithCounterpart(**fields)
+
+def to_match_request_outgoing(req, counterpart=None) -> MatchRequestOutgoingWithCounterpart:
+    fields = dict(
+        id=req.id,
+        mentorId=req.mentor_id,
+        menteeId=req.mentee_id,
+        status=req.status
+    )
+    if counterpart is not None:
+        fields["counterpart"] = to_user_summary(counterpart)
+    return MatchRequestOutgoingWithCounterpart(**fields)
+
+@router.get("/match-requests/incoming",
+           response_model=Union[List[MatchRequestWithCounterpart], MatchRequestPage],
+           response_model_exclude_unset=True)
 async def get_incoming_requests(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    status: Optional[str] = Query(None, description="상태 필터 (쉼표로 여러 개 지정 가능)"),
+    updatedSince: Optional[datetime] = Query(None, description="이 시각 이후 변경된 요청만 (이전 응답의 asOf)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 페이지 응답 반환)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    expand: Optional[str] = Query(None, regex="^counterpart$", description="counterpart 지정 시 상대방(멘티) 최소 프로필 포함"),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         # 멘토만 접근 가능
@@ -151,19 +258,38 @@ async def get_incoming_requests(
                 detail="멘토만 받은 요청을 볼 수 있습니다"
             )
         
-        requests = get_incoming_match_requests(db, current_user.id)
+        expand_counterpart = expand == "counterpart"
         
-        return [
-            MatchRequest(
-                id=req.id,
-                mentorId=req.mentor_id,
-                menteeId=req.mentee_id,
-                message=req.message,
-                status=req.status
+        # 페이지/변경분 파라미터가 없으면 기존과 같이 전체 목록 반환
+        if limit is None and cursor is None and updatedSince is None:
+            requests = await crud_async.get_incoming_match_requests(
+                db, current_user.id, status=status, expand_counterpart=expand_counterpart
             )
-            for req in requests
-        ]
+            return [to_match_request(req, req.mentee if expand_counterpart else None) for req in requests]
+        
+        # 조회 전 같은 세션의 DB 시각에서 겹침 구간만큼 앞당긴 시각 - 이후 변경은 다음 updatedSince 조회에 포함됨
+        as_of = await crud_async.get_match_request_feed_as_of(db, MATCH_REQUEST_FEED_OVERLAP_SECONDS)
+        requests, next_cursor = await crud_async.get_incoming_match_requests_page(
+            db,
+            current_user.id,
+            status=status,
+            updated_since=updatedSince,
+            limit=limit or DEFAULT_PAGE_SIZE,
+            cursor=cursor,
+            expand_counterpart=expand_counterpart
+        )
+        return MatchRequestPage(
+            items=[to_match_request(req, req.mentee if expand_counterpart else None) for req in requests],
+            nextCursor=next_cursor,
+            asOf=as_of
+        )
     
+    except ValueError as e:
+        # 잘못된 상태 필터 또는 커서
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -172,10 +298,17 @@ async def get_incoming_requests(
             detail="서버 내부 오류가 발생했습니다"
         )
 
-@router.get("/match-requests/outgoing", response_model=List[MatchRequestOutgoing])
+@router.get("/match-requests/outgoing",
+           response_model=Union[List[MatchRequestOutgoingWithCounterpart], MatchRequestOutgoingPage],
+           response_model_exclude_unset=True)
 async def get_outgoing_requests(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    status: Optional[str] = Query(None, description="상태 필터 (쉼표로 여러 개 지정 가능)"),
+    updatedSince: Optional[datetime] = Query(None, description="이 시각 이후 변경된 요청만 (이전 응답의 asOf)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 페이지 응답 반환)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    expand: Optional[str] = Query(None, regex="^counterpart$", description="counterpart 지정 시 상대방(멘토) 최소 프로필 포함"),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         # 멘티만 접근 가능
@@ -185,18 +318,36 @@ async def get_outgoing_requests(
                 detail="멘티만 보낸 요청을 볼 수 있습니다"
             )
         
-        requests = get_outgoing_match_requests(db, current_user.id)
+        expand_counterpart = expand == "counterpart"
         
-        return [
-            MatchRequestOutgoing(
-                id=req.id,
-                mentorId=req.mentor_id,
-                menteeId=req.mentee_id,
-                status=req.status
+        # 페이지/변경분 파라미터가 없으면 기존과 같이 전체 목록 반환
+        if limit is None and cursor is None and updatedSince is None:
+            requests = await crud_async.get_outgoing_match_requests(
+                db, current_user.id, status=status, expand_counterpart=expand_counterpart
             )
-            for req in requests
-        ]
+            return [to_match_request_outgoing(req, req.mentor if expand_counterpart else None) for req in requests]
+        
+        as_of = await crud_async.get_match_request_feed_as_of(db, MATCH_REQUEST_FEED_OVERLAP_SECONDS)
+        requests, next_cursor = await crud_async.get_outgoing_match_requests_page(
+            db,
+            current_user.id,
+            status=status,
+            updated_since=updatedSince,
+            limit=limit or DEFAULT_PAGE_SIZE,
+            cursor=cursor,
+            expand_counterpart=expand_counterpart
+        )
+        return MatchRequestOutgoingPage(
+            items=[to_match_request_outgoing(req, req.mentor if expand_counterpart else None) for req in requests],
+            nextCursor=next_cursor,
+            asOf=as_of
+        )
     
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -208,8 +359,8 @@ async def get_outgoing_requests(
 @router.put("/match-requests/{request_id}/accept", response_model=MatchRequest)
 async def accept_request(
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         # 멘토만 접근 가능
@@ -219,7 +370,7 @@ async def accept_request(
                 detail="멘토만 요청을 수락할 수 있습니다"
             )
         
-        match_request = accept_match_request(db, request_id, current_user.id)
+        match_request = await crud_async.accept_match_request(db, request_id, current_user.id)
         if not match_request:
             raise HTTPException(
                 status_code=404,
@@ -245,8 +396,8 @@ async def accept_request(
 @router.put("/match-requests/{request_id}/reject", response_model=MatchRequest)
 async def reject_request(
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         # 멘토만 접근 가능
@@ -256,7 +407,7 @@ async def reject_request(
                 detail="멘토만 요청을 거절할 수 있습니다"
             )
         
-        match_request = reject_match_request(db, request_id, current_user.id)
+        match_request = await crud_async.reject_match_request(db, request_id, current_user.id)
         if not match_request:
             raise HTTPException(
                 status_code=404,
@@ -279,11 +430,53 @@ async def reject_request(
             detail="서버 내부 오류가 발생했습니다"
         )
 
+@router.post("/match-requests/batch", response_model=MatchRequestBatchResponse)
+async def batch_update_requests(
+    batch: MatchRequestBatchRequest,
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        # 멘토만 접근 가능
+        if current_user.role != "mentor":
+            raise HTTPException(
+                status_code=403,
+                detail="멘토만 요청을 처리할 수 있습니다"
+            )
+        
+        # 모든 항목을 한 트랜잭션으로 처리하고 항목별 결과 반환
+        results = await crud_async.apply_match_request_actions(
+            db,
+            current_user.id,
+            [(item.id, item.action) for item in batch.actions]
+        )
+        
+        return MatchRequestBatchResponse(
+            results=[
+                MatchRequestBatchResult(
+                    id=request_id,
+                    action=action,
+                    success=error is None,
+                    status=new_status,
+                    error=error
+                )
+                for request_id, action, new_status, error in results
+            ]
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail="서버 내부 오류가 발생했습니다"
+        )
+
 @router.delete("/match-requests/{request_id}", response_model=MatchRequest)
 async def cancel_request(
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         # 멘티만 접근 가능
@@ -293,7 +486,7 @@ async def cancel_request(
                 detail="멘티만 요청을 취소할 수 있습니다"
             )
         
-        match_request = cancel_match_request(db, request_id, current_user.id)
+        match_request = await crud_async.cancel_match_request(db, request_id, current_user.id)
         if not match_request:
             raise HTTPException(
                 status_code=404,
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from app.core.cache import user_cache
+from app.core.security import token_cache
+
+router = APIRouter()
+
+@router.get("/metrics/cache",
+           summary="Cache metrics",
+           description="Hit/miss/eviction counters of the in-process caches of this worker")
+async def get_cache_metrics():
+    return {
+        "user": user_cache.stats(),
+        "token": token_cache.stats()
+    }
@@ -1,22 +1,64 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.responses import Response
-from sqlalchemy.orm import Session
-from app.db.database import get_db
-from app.schemas.user import User as UserProfile, MentorProfile, MenteeProfile, UpdateMentorProfileRequest, UpdateMenteeProfileRequest, ErrorResponse
-from app.auth import get_current_user
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from fastapi.responses import Response, FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_async_db, pin_primary
+from app.schemas.user import User as UserProfile, MentorProfile, MenteeProfile, UpdateMentorProfileRequest, UpdateMenteeProfileRequest, UserSummary, ErrorResponse
+from app.auth import get_current_user, get_current_principal, get_read_db, load_user_snapshot, credentials_exception, Principal, UserSnapshot
 from app.models.user import User
-from app.crud import update_user_profile, get_user_by_id
-from typing import Union
+from app.crud import aio as crud_async
+from app.core.pagination import MAX_PAGE_SIZE
+from app.storage import get_image_storage
+from app.storage.renditions import RENDITION_SIZES, RENDITION_MIME, rendition_key
+from typing import Union, Optional, List
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 
 router = APIRouter()
 
-def create_profile_response(user: User):
+# 버전 토큰이 붙은 이미지 URL 은 내용이 절대 바뀌지 않으므로 오래 캐시
+IMAGE_VERSION_LENGTH = 16
+IMAGE_CACHE_IMMUTABLE = "private, max-age=31536000, immutable"
+IMAGE_CACHE_REVALIDATE = "private, no-cache"
+
+def profile_image_url(role: str, user_id: int, image_hash: Optional[str]) -> str:
+    """이미지 해시 기반 버전 토큰이 포함된 프로필 이미지 URL"""
+    url = f"/images/{role}/{user_id}"
+    if image_hash:
+        url += f"?v={image_hash[:IMAGE_VERSION_LENGTH]}"
+    return url
+
+def to_user_summary(user) -> UserSummary:
+    return UserSummary(
+        id=user.id,
+        name=user.name,
+        role=user.role,
+        imageUrl=profile_image_url(user.role, user.id, user.image_hash)
+    )
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match 는 약한 비교 (W/ 접두어 무시)
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP 날짜는 초 단위
+    return last_modified.replace(microsecond=0) <= since
+
+def create_profile_response(user: Union[User, UserSnapshot]):
     """사용자 정보를 프로필 응답 형태로 변환"""
     if user.role == "mentor":
         profile = {
             "name": user.name,
             "bio": user.bio or "",
-            "imageUrl": f"/images/mentor/{user.id}",
+            "imageUrl": profile_image_url("mentor", user.id, user.image_hash),
             "skills": user.skills or []
         }
         return MentorProfile(
@@ -29,7 +71,7 @@ def create_profile_response(user: User):
         profile = {
             "name": user.name,
             "bio": user.bio or "",
-            "imageUrl": f"/images/mentee/{user.id}"
+            "imageUrl": profile_image_url("mentee", user.id, user.image_hash)
         }
         return MenteeProfile(
             id=user.id,
@@ -46,9 +88,53 @@ def create_profile_response(user: User):
                401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
                500: {"model": ErrorResponse, "description": "Internal server error"}
            })
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
+):
+    try:
+        user = await load_user_snapshot(db, current_user.id)
+        if user is None:
+            raise credentials_exception()
+        return create_profile_response(user)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error"
+        )
+
+@router.get("/users",
+           response_model=List[UserSummary],
+           summary="Get user summaries",
+           description="Retrieve minimal profiles of several users in one request (self, mentors and users connected by a match request)",
+           responses={
+               200: {"description": "User summaries retrieved successfully"},
+               400: {"model": ErrorResponse, "description": "Bad request - invalid ids"},
+               401: {"model": ErrorResponse, "description": "Unauthorized - authentication failed"},
+               500: {"model": ErrorResponse, "description": "Internal server error"}
+           })
+async def get_users(
+    ids: str = Query(..., description=f"쉼표로 구분된 사용자 ID (최대 {MAX_PAGE_SIZE}개)"),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
+):
     try:
-        return create_profile_response(current_user)
+        try:
+            user_ids = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="ids 는 쉼표로 구분된 정수여야 합니다")
+        if not user_ids or len(user_ids) > MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail=f"ids 는 1~{MAX_PAGE_SIZE}개여야 합니다")
+        
+        users = await crud_async.get_user_summaries(db, current_user.id, user_ids)
+        
+        # 요청한 ID 순서대로 반환 (조회할 수 없는 ID 는 제외)
+        by_id = {user.id: user for user in users}
+        return [to_user_summary(by_id[user_id]) for user_id in user_ids if user_id in by_id]
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -67,8 +153,11 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 async def get_profile_image(
     role: str,
     user_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    request: Request,
+    v: Optional[str] = Query(None, description="이미지 버전 토큰 (imageUrl 에 포함)"),
+    size: Optional[int] = Query(None, description=f"썸네일 크기 ({', '.join(map(str, RENDITION_SIZES))})"),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         # 역할 검증
@@ -78,25 +167,63 @@ async def get_profile_image(
                 detail="Invalid role. Must be 'mentor' or 'mentee'"
             )
         
-        # 사용자 찾기
-        user = get_user_by_id(db, user_id)
+        if size is not None and size not in RENDITION_SIZES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid size. Must be one of {list(RENDITION_SIZES)}"
+            )
+        
+        # 사용자 찾기 (역할과 이미지 컬럼만 조회)
+        user = await crud_async.get_profile_image(db, user_id)
         if not user or user.role != role:
             raise HTTPException(
                 status_code=404,
                 detail="User not found"
             )
         
-        # 프로필 이미지가 있는 경우 반환
-        if user.profile_image:
-            # 이미지 형식 감지
-            if user.profile_image.startswith(b'\xff\xd8'):
-                media_type = "image/jpeg"
-            elif user.profile_image.startswith(b'\x89PNG'):
-                media_type = "image/png"
-            else:
-                media_type = "image/jpeg"  # 기본값
+        # 프로필 이미지가 있는 경우 저장소에서 반환
+        if user.image_hash:
+            storage = get_image_storage()
+            key, media_type = user.image_hash, user.image_mime
+            
+            # 썸네일 요청이면 썸네일 키 사용 (아직 없는 이미지는 원본으로 대체)
+            if size is not None and storage.exists(rendition_key(user.image_hash, size)):
+                key, media_type = rendition_key(user.image_hash, size), RENDITION_MIME
             
-            return Response(content=user.profile_image, media_type=media_type)
+            etag = f'"{key}"'
+            headers = {
+                "ETag": etag,
+                # 현재 이미지의 버전 토큰으로 요청한 경우에만 장기 캐시 허용
+                "Cache-Control": IMAGE_CACHE_IMMUTABLE if v and user.image_hash.startswith(v) else IMAGE_CACHE_REVALIDATE
+            }
+            last_modified = None
+            if user.image_updated_at:
+                last_modified = user.image_updated_at
+                if last_modified.tzinfo is None:
+                    last_modified = last_modified.replace(tzinfo=timezone.utc)
+                headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+            
+            # 조건부 요청: 이미지를 읽지 않고 304 응답 (If-None-Match 가 있으면 If-Modified-Since 는 무시)
+            if_none_match = request.headers.get("if-none-match")
+            if_modified_since = request.headers.get("if-modified-since")
+            if if_none_match is not None:
+                if etag_matches(if_none_match, etag):
+                    return Response(status_code=304, headers=headers)
+            elif if_modified_since and last_modified and _not_modified_since(if_modified_since, last_modified):
+                return Response(status_code=304, headers=headers)
+            
+            # 로컬 파일이면 FileResponse 로 전송 (sendfile 지원 서버에서는 제로카피)
+            path = storage.local_path(key)
+            if path:
+                return FileResponse(path, media_type=media_type, headers=headers)
+            
+            data = storage.get(key)
+            if data is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail="Image not found"
+                )
+            return Response(content=data, media_type=media_type, headers=headers)
         else:
             # 기본 이미지로 리다이렉트
             from fastapi.responses import RedirectResponse
@@ -125,7 +252,7 @@ async def get_profile_image(
 async def update_profile(
     profile_data: Union[UpdateMentorProfileRequest, UpdateMenteeProfileRequest],
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         # 프로필 데이터의 사용자 ID가 현재 사용자와 일치하는지 확인
@@ -142,8 +269,15 @@ async def update_profile(
                 detail="Role cannot be changed"
             )
         
+        # 이미지 검증/저장/썸네일 생성은 스레드 풀에서 먼저 수행하고 DB 에는 결과만 기록
+        image = None
+        if profile_data.image and profile_data.image.strip():
+            image = await crud_async.store_profile_image(profile_data.image)
+        
         # 프로필 업데이트
-        updated_user = update_user_profile(db, current_user, profile_data)
+        updated_user = await crud_async.update_user_profile(db, current_user, profile_data, image)
+        # 본인만 고정 - 다른 사용자는 복제 지연 동안 이전 프로필을 볼 수 있음
+        await pin_primary(current_user.id)
         return create_profile_response(updated_user)
     
     except ValueError as e:
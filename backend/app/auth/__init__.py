@@ -1,39 +1,185 @@
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, status, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.core.security import verify_token
-from app.db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from app.core.security import verify_token, verify_stream_ticket, is_token_revoked, revoke_token
+from app.core.cache import user_cache
+from app.db.database import get_async_db, read_sessionmaker_for
 from app.models.user import User
+from app.crud import aio as crud_async
+import os
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
-    credentials_exception = HTTPException(
+# 인증 모드
+# - stateless: 역할 검사만 필요한 엔드포인트는 검증된 JWT 클레임으로 Principal 을 만들고 DB 를 조회하지 않음
+# - database: 모든 요청에서 사용자 존재 여부를 DB 로 확인
+AUTH_MODE = os.getenv("AUTH_MODE", "stateless")
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자의 최소 정보 (ORM 객체가 필요 없는 엔드포인트용)"""
+    id: int
+    email: str
+    name: str
+    role: str
+    jti: Optional[str] = None
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """캐시용 사용자 정보 (이미지 바이너리/비밀번호 해시 없음, 변경 불가)"""
+    id: int
+    email: str
+    name: str
+    role: str
+    bio: Optional[str]
+    skills: Optional[Tuple[str, ...]]
+    image_hash: Optional[str]
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            role=user.role,
+            bio=user.bio,
+            skills=tuple(user.skills) if user.skills is not None else None,
+            image_hash=user.image_hash
+        )
+
+def credentials_exception():
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
-    token = credentials.credentials
-    payload = verify_token(token)
-    
+
+def _normalize_claims(payload: Optional[dict]) -> dict:
+    """검증된 클레임의 user_id 를 int 로 정규화 (없거나 잘못되면 401)"""
     if payload is None:
-        raise credentials_exception
+        raise credentials_exception()
     
     user_id = payload.get("user_id")
     if user_id is None:
-        raise credentials_exception
+        raise credentials_exception()
     
     try:
         user_id = int(user_id)
     except (ValueError, TypeError):
-        raise credentials_exception
+        raise credentials_exception()
     
-    user = db.query(User).filter(User.id == user_id).first()
+    return {**payload, "user_id": user_id}
+
+async def payload_from_token(token: str) -> dict:
+    """JWT 검증 + 폐기 여부 확인 후 user_id 를 int 로 정규화한 클레임 반환"""
+    payload = _normalize_claims(verify_token(token))
+    if await is_token_revoked(payload):
+        raise credentials_exception()
+    
+    return payload
+
+async def payload_from_stream_ticket(ticket: str) -> dict:
+    """
+    스트림 연결 티켓 검증 후 발급에 쓴 액세스 토큰의 클레임(jti/exp)으로 바꿔 반환
+
+    티켓은 사용하는 즉시 폐기해 다시 쓸 수 없고, 액세스 토큰이 폐기됐으면 거부한다.
+    """
+    claims = _normalize_claims(verify_stream_ticket(ticket))
+    if await is_token_revoked(claims):
+        raise credentials_exception()
+    await revoke_token(claims)
+    
+    payload = {**claims, "jti": claims.get("token_jti"), "exp": claims.get("token_exp")}
+    if await is_token_revoked(payload):
+        raise credentials_exception()
+    
+    return payload
+
+async def get_token_payload(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    return await payload_from_token(credentials.credentials)
+
+async def get_stream_token_payload(
+    ticket: Optional[str] = Query(None, description="EventSource 처럼 헤더를 지정할 수 없는 클라이언트용 연결 티켓 (POST /api/events/ticket)"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> dict:
+    """스트리밍 연결용 - Authorization 헤더가 없으면 ?ticket= 의 일회용 연결 티켓 사용"""
+    if credentials is not None:
+        return await payload_from_token(credentials.credentials)
+    if ticket:
+        return await payload_from_stream_ticket(ticket)
+    raise credentials_exception()
+
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_async_db)
+):
+    user = await crud_async.get_user_by_id(db, payload["user_id"])
     if user is None:
-        raise credentials_exception
+        raise credentials_exception()
+    
+    return user
+
+async def load_user_snapshot(db: AsyncSession, user_id: int) -> Optional[UserSnapshot]:
+    """TTL/LRU 캐시에 있으면 캐시에서, 없으면 DB 에서 사용자 스냅샷 조회"""
+    snapshot = user_cache.get(user_id)
+    if snapshot is None:
+        user = await crud_async.get_user_by_id(db, user_id)
+        if user is None:
+            return None
+        snapshot = UserSnapshot.from_user(user)
+        user_cache.set(user_id, snapshot)
+    
+    return snapshot
+
+async def get_current_user_snapshot(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_async_db)
+) -> UserSnapshot:
+    """DB 로 사용자 존재를 확인하되 캐시에 있으면 조회 생략"""
+    snapshot = await load_user_snapshot(db, payload["user_id"])
+    if snapshot is None:
+        raise credentials_exception()
     
-    return user
\ No newline at end of file
+    return snapshot
+
+def _principal_from_claims(payload: dict = Depends(get_token_payload)) -> Principal:
+    role = payload.get("role")
+    if role not in ("mentor", "mentee") or not payload.get("email"):
+        raise credentials_exception()
+    
+    return Principal(
+        id=payload["user_id"],
+        email=payload["email"],
+        name=payload.get("name", ""),
+        role=role,
+        jti=payload.get("jti")
+    )
+
+async def _principal_from_database(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    user = await get_current_user_snapshot(payload, db)
+    return Principal(id=user.id, email=user.email, name=user.name, role=user.role, jti=payload.get("jti"))
+
+# 역할/ID 만 필요한 엔드포인트는 get_current_principal, ORM 객체가 필요하면 get_current_user 사용
+get_current_principal = _principal_from_claims if AUTH_MODE == "stateless" else _principal_from_database
+
+async def get_stream_principal(payload: dict = Depends(get_stream_token_payload)) -> Principal:
+    """
+    스트리밍 연결용 Principal (연결이 유지되는 동안 DB 커넥션을 잡고 있지 않도록 짧은 세션으로만 확인)
+
+    연결 티켓에는 사용자 정보 클레임이 없으므로 티켓으로 연결하면 캐시/DB 에서 조회한다.
+    """
+    if AUTH_MODE == "stateless" and payload.get("email"):
+        return _principal_from_claims(payload)
+    async with (await read_sessionmaker_for(payload["user_id"]))() as db:
+        return await _principal_from_database(payload, db)
+
+async def get_read_db(current_user: Principal = Depends(get_current_principal)):
+    """읽기 복제본 세션 (현재 사용자가 방금 쓰기를 했다면 기본 DB)"""
+    async with (await read_sessionmaker_for(current_user.id))() as db:
+        yield db
@@ -0,0 +1,177 @@
+"""
+멘토 디렉터리 스냅샷
+
+멘토 목록 전체를 메모리에 정렬된 상태로 유지해 /api/mentors 를 DB 조회 없이 응답한다.
+- 정렬 모드(id, name, skill)별로 미리 정렬된 키 목록과 skill -> 멘토 ID 역색인을 가진다.
+- 스냅샷은 변경 불가이며, 멘토가 가입하거나 프로필을 수정하면 해당 항목만 바꾼 새 스냅샷으로 교체한다.
+- 버전(etag)은 내용이 바뀔 때마다 달라지므로 클라이언트는 If-None-Match 로 304 를 받을 수 있다.
+- 다시 읽기/갱신 규칙은 app.core.snapshot 을 따른다.
+"""
+import bisect
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.snapshot import VersionedSnapshot
+
+# 전체 스냅샷을 DB 에서 다시 읽는 주기 (초), 0 이면 비활성화 (매 요청 DB 조회)
+MENTOR_DIRECTORY_TTL = float(os.getenv("MENTOR_DIRECTORY_TTL", "60"))
+
+@dataclass(frozen=True)
+class MentorEntry:
+    """목록 응답에 필요한 멘토 정보"""
+    id: int
+    email: str
+    name: str
+    bio: Optional[str]
+    skills: Tuple[str, ...]
+    image_hash: Optional[str]
+
+    @classmethod
+    def from_user(cls, user) -> "MentorEntry":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            bio=user.bio,
+            skills=tuple(user.skills or ()),
+            image_hash=user.image_hash
+        )
+
+def skill_sort_key(skills: Optional[Iterable[str]]) -> str:
+    """스킬 정렬 키: 대표(첫 번째) 스킬을 정규화한 값, 스킬이 없으면 빈 문자열 (users.skill_sort_key)"""
+    for skill in skills or ():
+        return skill.strip().lower()
+    return ""
+
+# 정렬 모드별 정렬 키 (마지막은 항상 유일한 id, app.crud.MENTOR_KEYSET_COLUMNS 와 같은 순서)
+SORT_KEYS = {
+    "id": lambda entry: (entry.id,),
+    "name": lambda entry: (entry.name, entry.id),
+    "skill": lambda entry: (skill_sort_key(entry.skills), entry.name, entry.id),
+}
+
+# 커서 페이지네이션이 가능한 정렬 모드와 키 타입 (app.crud.MENTOR_KEYSET_COLUMNS 와 같은 커서 형식)
+KEYSET_TYPES = {"id": (int,), "name": (str, int), "skill": (str, str, int)}
+
+def _digest(entries: Iterable[MentorEntry]) -> str:
+    hasher = hashlib.sha256()
+    for entry in sorted(entries, key=lambda entry: entry.id):
+        hasher.update(repr(entry).encode())
+    return hasher.hexdigest()[:16]
+
+class MentorDirectorySnapshot:
+    """한 시점의 멘토 디렉터리 (생성 후 변경하지 않음)"""
+
+    def __init__(self, entries: Dict[int, MentorEntry], generation: str, version: int = 0):
+        self.entries = entries
+        self.generation = generation
+        self.version = version
+        self.orders: Dict[str, List[tuple]] = {
+            mode: sorted(key(entry) for entry in entries.values())
+            for mode, key in SORT_KEYS.items()
+        }
+        index: Dict[str, set] = {}
+        for entry in entries.values():
+            for skill in entry.skills:
+                index.setdefault(skill, set()).add(entry.id)
+        self.skill_index: Dict[str, FrozenSet[int]] = {skill: frozenset(ids) for skill, ids in index.items()}
+
+    @property
+    def etag(self) -> str:
+        return f'"mentors-{self.version}-{self.generation}"'
+
+    def with_entry(self, entry: MentorEntry) -> "MentorDirectorySnapshot":
+        """entry 하나를 추가/교체한 다음 버전 스냅샷 (정렬 목록은 해당 키만 갱신)"""
+        previous = self.entries.get(entry.id)
+        if previous == entry:
+            return self
+
+        snapshot = MentorDirectorySnapshot.__new__(MentorDirectorySnapshot)
+        snapshot.entries = dict(self.entries)
+        # 워커마다 다른 변경이 적용돼도 같은 etag 가 나오지 않도록 변경 내용을 이어서 해시
+        snapshot.generation = hashlib.sha256(
+            f"{self.generation}:{entry!r}".encode()
+        ).hexdigest()[:16]
+        snapshot.version = self.version + 1
+        snapshot.orders = {}
+        snapshot.skill_index = dict(self.skill_index)
+
+        for mode, key in SORT_KEYS.items():
+            keys = list(self.orders[mode])
+            if previous is not None:
+                del keys[bisect.bisect_left(keys, key(previous))]
+            bisect.insort(keys, key(entry))
+            snapshot.orders[mode] = keys
+
+        if previous is not None:
+            for skill in set(previous.skills):
+                remaining = snapshot.skill_index[skill] - {entry.id}
+                if remaining:
+                    snapshot.skill_index[skill] = remaining
+                else:
+                    del snapshot.skill_index[skill]
+        for skill in set(entry.skills):
+            snapshot.skill_index[skill] = snapshot.skill_index.get(skill, frozenset()) | {entry.id}
+        snapshot.entries[entry.id] = entry
+
+        return snapshot
+
+    def _matching_keys(self, skills: List[str], match_all: bool, mode: str) -> List[tuple]:
+        """스킬 필터를 통과한 멘토의 정렬 키 목록 (정렬됨)"""
+        if not skills:
+            return self.orders[mode]
+        id_sets = [self.skill_index.get(skill, frozenset()) for skill in skills]
+        ids = frozenset.intersection(*id_sets) if match_all else frozenset().union(*id_sets)
+        key = SORT_KEYS[mode]
+        return sorted(key(self.entries[mentor_id]) for mentor_id in ids)
+
+    def mentors(self, skills: List[str], match_all: bool = False, order_by: Optional[str] = None) -> List[MentorEntry]:
+        keys = self._matching_keys(skills, match_all, order_by or "id")
+        return [self.entries[key[-1]] for key in keys]
+
+    def page(
+        self,
+        skills: List[str],
+        match_all: bool,
+        order_by: Optional[str],
+        limit: int,
+        cursor: Optional[str]
+    ) -> Tuple[List[MentorEntry], Optional[str]]:
+        """app.crud.get_mentors_page 와 같은 규칙의 키셋 페이지"""
+        mode = order_by or "id"
+        if mode not in KEYSET_TYPES:
+            raise ValueError(f"order_by={mode} 는 커서 페이지네이션을 지원하지 않습니다")
+
+        keys = self._matching_keys(skills, match_all, mode)
+        start = 0
+        if cursor:
+            types = KEYSET_TYPES[mode]
+            after = tuple(decode_cursor(cursor, mode, len(types), types))
+            start = bisect.bisect_right(keys, after)
+
+        page_keys = keys[start:start + limit + 1]
+        next_cursor = None
+        if len(page_keys) > limit:
+            page_keys = page_keys[:limit]
+            next_cursor = encode_cursor(mode, list(page_keys[-1]))
+
+        return [self.entries[key[-1]] for key in page_keys], next_cursor
+
+class MentorDirectory(VersionedSnapshot[MentorDirectorySnapshot]):
+    """현재 스냅샷을 들고 있다가 변경 시 새 스냅샷으로 교체"""
+
+    def build(self, mentors: Iterable) -> MentorDirectorySnapshot:
+        """DB 에서 읽은 전체 멘토로 스냅샷 생성 (내용이 그대로면 버전도 그대로 유지)"""
+        entries = {entry.id: entry for entry in map(MentorEntry.from_user, mentors)}
+        previous = self.latest()
+        if previous is not None and previous.entries == entries:
+            return MentorDirectorySnapshot(entries, previous.generation, previous.version)
+        return MentorDirectorySnapshot(entries, _digest(entries.values()))
+
+    def upsert(self, entry: MentorEntry):
+        if self.enabled:
+            self.apply(lambda snapshot: snapshot.with_entry(entry))
+
+mentor_directory = MentorDirectory(ttl=MENTOR_DIRECTORY_TTL)
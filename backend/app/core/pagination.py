@@ -0,0 +1,63 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+
+커서는 마지막으로 반환한 행의 정렬 키 값을 담은 불투명 문자열이다.
+다음 페이지는 OFFSET 대신 "(정렬 키) > (커서 값)" 조건으로 인덱스 범위 검색을 하므로
+몇 번째 페이지든 비용이 일정하다.
+"""
+import base64
+import json
+import math
+from typing import Any, List, Optional, Sequence
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+def encode_cursor(mode: str, values: Sequence[Any]) -> str:
+    """정렬 모드와 마지막 행의 정렬 키 값을 커서 문자열로 인코딩"""
+    payload = json.dumps({"o": mode, "k": list(values)}, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def column_types(columns: Sequence) -> List[type]:
+    """정렬 키 컬럼들의 파이썬 타입 (decode_cursor 의 types)"""
+    return [column.type.python_type for column in columns]
+
+def _matches_type(value: Any, expected: type) -> bool:
+    # bool 은 int 의 하위 타입이므로 따로 거름, float 키는 JSON 에서 정수로 올 수 있음
+    if isinstance(value, bool):
+        return False
+    if expected is float:
+        return isinstance(value, (int, float)) and math.isfinite(value)
+    return isinstance(value, expected)
+
+def decode_cursor(cursor: str, mode: str, size: int, types: Optional[Sequence[type]] = None) -> List[Any]:
+    """
+    커서 문자열을 정렬 키 값 목록으로 디코딩 (잘못된 커서는 ValueError)
+
+    types 를 주면 각 값이 해당 타입인지도 확인한다 (조작된 커서가 정렬/SQL 비교에서 500 이 되지 않도록).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["k"]
+    except Exception:
+        raise ValueError("잘못된 커서입니다")
+
+    if not isinstance(payload, dict) or payload.get("o") != mode or not isinstance(values, list) or len(values) != size:
+        raise ValueError("커서가 현재 정렬 기준과 일치하지 않습니다")
+    if types is not None and not all(_matches_type(value, expected) for value, expected in zip(values, types)):
+        raise ValueError("잘못된 커서입니다")
+    return values
+
+def keyset_after(columns: Sequence, values: Sequence[Any]):
+    """(columns) > (values) 조건 - 오름차순 정렬의 다음 페이지"""
+    if len(columns) == 1:
+        return columns[0] > values[0]
+    return tuple_(*columns) > tuple_(*values)
+
+def keyset_before(columns: Sequence, values: Sequence[Any]):
+    """(columns) < (values) 조건 - 내림차순(최신순) 정렬의 다음 페이지"""
+    if len(columns) == 1:
+        return columns[0] < values[0]
+    return tuple_(*columns) < tuple_(*values)
@@ -0,0 +1,148 @@
+"""
+멘토 추천 엔진
+
+멘토 x 스킬 행렬을 NumPy 비트셋(uint64 워드)으로 메모리에 유지하고,
+질의 스킬 비트셋과의 AND + popcount 로 모든 멘토의 겹치는 스킬 수를 한 번에 계산한다.
+
+점수 = 겹치는 스킬 수 + RECOMMEND_AVAILABILITY_WEIGHT * (수락된 요청이 없는 멘토이면 1)
+
+멘토 가입/프로필 수정과 요청 수락/취소 시 해당 행만 갱신한다 (다시 읽기/갱신 규칙은 app.core.snapshot).
+"""
+import os
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+from app.core.snapshot import VersionedSnapshot
+
+# 전체 행렬을 DB 에서 다시 읽는 주기 (초), 0 이면 매 요청 새로 만듦
+RECOMMEND_TTL = float(os.getenv("RECOMMEND_TTL", "300"))
+# 수락된 요청이 없는(매칭 가능한) 멘토에게 더하는 점수 (스킬 하나 = 1.0)
+RECOMMEND_AVAILABILITY_WEIGHT = float(os.getenv("RECOMMEND_AVAILABILITY_WEIGHT", "0.5"))
+
+WORD_BITS = 64
+
+# 바이트별 1 비트 수 (uint64 를 uint8 로 보고 표를 조회하는 popcount)
+POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+class SkillMatrix:
+    """멘토 행 x 스킬 비트 행렬 (새 멘토의 행은 뒤에 추가)"""
+
+    def __init__(self, capacity: int = 1024, words: int = 1):
+        self.skill_bits: Dict[str, int] = {}
+        self.row_of: Dict[int, int] = {}
+        self.size = 0
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.bits = np.zeros((capacity, words), dtype=np.uint64)
+        self.available = np.zeros(capacity, dtype=bool)
+
+    @classmethod
+    def build(cls, mentors: Iterable[Tuple[int, Optional[List[str]]]], unavailable_ids: Set[int]) -> "SkillMatrix":
+        mentors = list(mentors)
+        skills = sorted({skill for _, mentor_skills in mentors for skill in (mentor_skills or ())})
+        matrix = cls(
+            capacity=max(len(mentors), 1024),
+            words=max((len(skills) + WORD_BITS - 1) // WORD_BITS, 1)
+        )
+        matrix.skill_bits = {skill: bit for bit, skill in enumerate(skills)}
+        for mentor_id, mentor_skills in mentors:
+            matrix.upsert(mentor_id, mentor_skills, available=mentor_id not in unavailable_ids)
+        return matrix
+
+    def _bit(self, skill: str) -> int:
+        bit = self.skill_bits.get(skill)
+        if bit is None:
+            bit = len(self.skill_bits)
+            self.skill_bits[skill] = bit
+            if bit >= self.bits.shape[1] * WORD_BITS:
+                self.bits = np.hstack([self.bits, np.zeros((self.bits.shape[0], 1), dtype=np.uint64)])
+        return bit
+
+    def _grow(self):
+        capacity = len(self.ids) * 2
+        self.ids = np.resize(self.ids, capacity)
+        self.bits = np.vstack([self.bits, np.zeros_like(self.bits)])
+        self.available = np.concatenate([self.available, np.zeros(len(self.available), dtype=bool)])
+
+    def upsert(self, mentor_id: int, skills: Optional[List[str]], available: Optional[bool] = None):
+        """멘토 행의 스킬 비트 교체 (available 이 None 이면 기존 값 유지, 새 멘토는 True)"""
+        row = self.row_of.get(mentor_id)
+        if row is None:
+            if self.size == len(self.ids):
+                self._grow()
+            row = self.size
+            self.size += 1
+            self.row_of[mentor_id] = row
+            self.ids[row] = mentor_id
+            self.available[row] = True
+
+        bits = [self._bit(skill) for skill in set(skills or ())]
+        self.bits[row] = 0
+        for bit in bits:
+            self.bits[row, bit // WORD_BITS] |= np.uint64(1 << (bit % WORD_BITS))
+        if available is not None:
+            self.available[row] = available
+
+    def set_available(self, mentor_id: int, available: bool):
+        row = self.row_of.get(mentor_id)
+        if row is not None:
+            self.available[row] = available
+
+    def overlap(self, skills: List[str]) -> np.ndarray:
+        """모든 행의 질의 스킬과 겹치는 스킬 수"""
+        query = np.zeros(self.bits.shape[1], dtype=np.uint64)
+        for skill in skills:
+            bit = self.skill_bits.get(skill)
+            if bit is not None:
+                query[bit // WORD_BITS] |= np.uint64(1 << (bit % WORD_BITS))
+
+        # 질의 비트가 있는 워드만 계산
+        words = np.flatnonzero(query)
+        if len(words) == 0:
+            return np.zeros(self.size, dtype=np.int32)
+        masked = np.ascontiguousarray(self.bits[:self.size, words] & query[words])
+        return POPCOUNT_TABLE[masked.view(np.uint8)].sum(axis=1, dtype=np.int32)
+
+    def top_k(self, skills: List[str], k: int, availability_weight: float) -> List[Tuple[int, float, bool]]:
+        """점수 상위 k 명의 (mentor_id, score, available) - 점수가 같으면 id 오름차순"""
+        if self.size == 0 or k <= 0:
+            return []
+
+        scores = self.overlap(skills).astype(np.float64)
+        scores += availability_weight * self.available[:self.size]
+
+        candidates = np.arange(self.size)
+        if len(candidates) > k:
+            # k 번째 점수보다 높은 행 전부 + 같은 점수 중 id 가 작은 행 (결과가 항상 같도록)
+            threshold = np.partition(scores[candidates], len(candidates) - k)[len(candidates) - k]
+            above = candidates[scores[candidates] > threshold]
+            ties = candidates[scores[candidates] == threshold]
+            ties = ties[np.argsort(self.ids[ties], kind="stable")][:k - len(above)]
+            candidates = np.concatenate([above, ties])
+
+        order = np.lexsort((self.ids[candidates], -scores[candidates]))
+        rows = candidates[order]
+        return [(int(self.ids[row]), float(scores[row]), bool(self.available[row])) for row in rows]
+
+class MentorRecommender(VersionedSnapshot[SkillMatrix]):
+    """현재 SkillMatrix 를 들고 있다가 변경 시 해당 행만 갱신"""
+
+    def __init__(self, ttl: float, availability_weight: float):
+        super().__init__(ttl)
+        self.availability_weight = availability_weight
+
+    def build(self, source: Tuple[Iterable[Tuple[int, Optional[List[str]]]], Set[int]]) -> SkillMatrix:
+        """(멘토 목록, 수락된 요청이 있는 멘토 ID) 로 행렬 생성"""
+        mentors, unavailable_ids = source
+        return SkillMatrix.build(mentors, unavailable_ids)
+
+    def recommend(self, matrix: SkillMatrix, skills: List[str], k: int) -> List[Tuple[int, float, bool]]:
+        # 행 갱신(apply)과 겹치지 않도록 같은 잠금 안에서 계산
+        with self._lock:
+            return matrix.top_k(skills, k, self.availability_weight)
+
+    def upsert(self, mentor_id: int, skills: Optional[List[str]]):
+        self.apply(lambda matrix: matrix.upsert(mentor_id, skills))
+
+    def set_available(self, mentor_id: int, available: bool):
+        self.apply(lambda matrix: matrix.set_available(mentor_id, available))
+
+mentor_recommender = MentorRecommender(ttl=RECOMMEND_TTL, availability_weight=RECOMMEND_AVAILABILITY_WEIGHT)
@@ -0,0 +1,76 @@
+"""
+토큰 폐기 저장소
+
+로그아웃한 토큰(jti)을 보관한다.
+TOKEN_REVOCATION_BACKEND 로 구현을 선택한다.
+- memory: 프로세스 메모리 (단일 워커, 재시작 시 초기화)
+- redis: Redis 키 (모든 워커가 공유하고 재시작 후에도 유지, requirements-redis.txt 필요)
+
+기록은 토큰 최대 수명(ACCESS_TOKEN_EXPIRE_HOURS)이 지나면 의미가 없으므로 그 뒤 자동으로 사라진다.
+"""
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+TOKEN_REVOCATION_BACKEND = os.getenv("TOKEN_REVOCATION_BACKEND", "memory")
+TOKEN_REVOCATION_URL = os.getenv("TOKEN_REVOCATION_URL", "redis://localhost:6379/0")
+
+class RevocationStore:
+    """토큰 폐기 저장소 인터페이스"""
+
+    async def revoke_token(self, jti: str, expires_at: float):
+        """jti 를 expires_at(토큰 exp)까지 폐기"""
+        raise NotImplementedError
+
+    async def is_revoked(self, jti: str) -> bool:
+        raise NotImplementedError
+
+class MemoryRevocationStore(RevocationStore):
+    """같은 프로세스에서 검사하는 토큰에만 적용"""
+
+    def __init__(self):
+        self._jtis: Dict[str, float] = {}  # jti -> exp
+        self._lock = threading.Lock()
+
+    async def revoke_token(self, jti: str, expires_at: float):
+        now = time.time()
+        with self._lock:
+            for expired in [key for key, exp in self._jtis.items() if exp <= now]:
+                del self._jtis[expired]
+            self._jtis[jti] = expires_at
+
+    async def is_revoked(self, jti: str) -> bool:
+        return jti in self._jtis
+
+class RedisRevocationStore(RevocationStore):
+    """Redis 키 - 어느 워커에서 폐기해도 모든 워커에 바로 적용"""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+        self._redis = redis.from_url(url)
+
+    @staticmethod
+    def _jti_key(jti: str) -> str:
+        return f"revoked:jti:{jti}"
+
+    async def revoke_token(self, jti: str, expires_at: float):
+        ttl = int(expires_at - time.time()) + 1
+        if ttl > 0:
+            await self._redis.set(self._jti_key(jti), 1, ex=ttl)
+
+    async def is_revoked(self, jti: str) -> bool:
+        return bool(await self._redis.exists(self._jti_key(jti)))
+
+_store: Optional[RevocationStore] = None
+
+def get_revocation_store() -> RevocationStore:
+    global _store
+    if _store is None:
+        if TOKEN_REVOCATION_BACKEND == "memory":
+            _store = MemoryRevocationStore()
+        elif TOKEN_REVOCATION_BACKEND == "redis":
+            _store = RedisRevocationStore(TOKEN_REVOCATION_URL)
+        else:
+            raise ValueError(f"지원하지 않는 토큰 폐기 저장소입니다: {TOKEN_REVOCATION_BACKEND}")
+    return _store
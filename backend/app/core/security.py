@@ -1,8 +1,15 @@
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import time
 import uuid
 import os
+from app.core.cache import TTLCache
+from app.core.revocation import get_revocation_store
 
 # 시크릿 키 (환경변수에서 가져오거나 기본값 사용)
 SECRET_KEY = os.getenv("SECRET_KEY", "your-very-secure-secret-key-change-in-production")
@@ -11,12 +18,44 @@ ACCESS_TOKEN_EXPIRE_HOURS = 1  # 요구사항에 따라 1시간으로 변경
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt 해싱 전용 스레드 풀 (bcrypt 는 GIL 을 풀고 실행되므로 이벤트 루프를 막지 않음)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+# 실행 중 + 대기 중인 해싱 작업 최대 개수 (초과 시 503)
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "1"))
+
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+_password_pending = 0
+
+class PasswordHasherBusy(Exception):
+    """해싱 풀이 포화 상태"""
+    pass
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+async def _run_password_task(func, *args):
+    global _password_pending
+    # 대기열이 가득 차면 큐에 쌓지 않고 바로 거절
+    if _password_pending >= PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHasherBusy()
+    
+    _password_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, func, *args)
+    finally:
+        _password_pending -= 1
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_password_task(get_password_hash, password)
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
@@ -35,7 +74,63 @@ def create_access_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+# 이벤트 스트림 연결 티켓 - EventSource 는 헤더를 지정할 수 없어 URL 로 전달되므로
+# 액세스 토큰 대신 스트림 연결에만 쓸 수 있고(aud) 곧 만료되는 일회용 JWT 를 사용
+EVENT_TICKET_SECONDS = int(os.getenv("EVENT_TICKET_SECONDS", "30"))
+EVENT_TICKET_AUDIENCE = "mentor-mentee-events"
+
+def create_stream_ticket(payload: dict) -> str:
+    """
+    검증된 액세스 토큰 클레임으로 티켓 발급 (액세스 토큰의 jti/exp 를 token_jti/token_exp 로 이어받음)
+
+    로그에 남을 수 있으므로 이메일/이름은 넣지 않는다.
+    """
+    now = int(time.time())
+    claims = {
+        "user_id": payload.get("user_id"),
+        "iss": "mentor-mentee-app",
+        "sub": str(payload.get("user_id")),
+        "aud": EVENT_TICKET_AUDIENCE,
+        "exp": min(now + EVENT_TICKET_SECONDS, payload["exp"]),
+        "iat": now,
+        "jti": str(uuid.uuid4()),
+        "token_jti": payload.get("jti"),
+        "token_exp": payload["exp"]
+    }
+    return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+def verify_stream_ticket(ticket: str) -> Optional[dict]:
+    try:
+        return jwt.decode(
+            ticket,
+            SECRET_KEY,
+            algorithms=[ALGORITHM],
+            audience=EVENT_TICKET_AUDIENCE,
+            issuer="mentor-mentee-app"
+        )
+    except JWTError:
+        return None
+
+# 검증된 토큰 캐시 (토큰 SHA-256 -> 클레임), 토큰의 exp 에 맞춰 만료
+TOKEN_CACHE_ENABLED = os.getenv("TOKEN_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+
+token_cache = TTLCache(
+    maxsize=TOKEN_CACHE_SIZE if TOKEN_CACHE_ENABLED else 0,
+    ttl=ACCESS_TOKEN_EXPIRE_HOURS * 3600
+)
+
 def verify_token(token: str):
+    cache_key = None
+    if token_cache.enabled:
+        cache_key = hashlib.sha256(token.encode()).digest()
+        payload = token_cache.get(cache_key)
+        if payload is not None:
+            now = time.time()
+            if payload.get("nbf", 0) <= now < payload["exp"]:
+                return dict(payload)
+            token_cache.invalidate(cache_key)
+    
     try:
         payload = jwt.decode(
             token, 
@@ -44,6 +139,23 @@ def verify_token(token: str):
             audience="mentor-mentee-api",
             issuer="mentor-mentee-app"
         )
-        return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+    
+    # 서명/클레임 검증을 통과한 토큰만 캐시
+    if cache_key is not None and isinstance(payload.get("exp"), (int, float)):
+        token_cache.set(cache_key, dict(payload), expires_at=payload["exp"])
+    return payload
+
+# 토큰 폐기 목록 (TOKEN_REVOCATION_BACKEND 로 워커 간 공유 여부 선택, app.core.revocation 참고)
+async def revoke_token(payload: dict):
+    """토큰 하나(jti)를 만료 시각까지 폐기"""
+    jti = payload.get("jti")
+    if not jti:
+        return
+    expires_at = payload.get("exp", time.time() + ACCESS_TOKEN_EXPIRE_HOURS * 3600)
+    await get_revocation_store().revoke_token(jti, expires_at)
+
+async def is_token_revoked(payload: dict) -> bool:
+    jti = payload.get("jti")
+    return jti is not None and await get_revocation_store().is_revoked(jti)
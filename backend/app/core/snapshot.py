@@ -0,0 +1,84 @@
+"""
+워커 메모리의 버전 스냅샷
+
+멘토 디렉터리(app.core.directory)와 추천 행렬(app.core.recommend)이 공유하는 규칙:
+- 값은 TTLCache 처럼 워커마다 따로 유지되며 TTL 이 지나면 DB 에서 다시 만든다.
+- 이 워커의 변경은 apply 로 현재 값에 바로 적용하고 변경 횟수를 센다.
+  전체 로드 도중 변경이 있었다면 읽은 내용이 오래됐을 수 있으므로 교체하지 않고 그 요청에만 사용한다.
+- 다시 읽기는 한 요청만 수행하고(refresh_lock) 그동안 다른 요청은 이전 값으로 응답한다.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Generic, Optional, TypeVar
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+class VersionedSnapshot(Generic[T]):
+    """TTL 마다 DB 에서 다시 만들고, 그 사이 변경은 제자리에서 반영하는 값 (build 를 구현해 사용)"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._value: Optional[T] = None
+        self._loaded_at = 0.0
+        self._changes = 0
+        self._lock = threading.Lock()
+        self.refresh_lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def build(self, source: Any) -> T:
+        """DB 에서 읽은 source 로 새 값 생성 (스레드 풀에서 호출)"""
+        raise NotImplementedError
+
+    def latest(self) -> Optional[T]:
+        return self._value
+
+    def current(self) -> Optional[T]:
+        """유효한 값 (없거나 TTL 이 지났으면 None)"""
+        if self._value is None or self._loaded_at + self.ttl <= time.time():
+            return None
+        return self._value
+
+    async def get(self, fetch: Callable[[], Awaitable[Any]]) -> T:
+        """
+        현재 값 (없거나 TTL 이 지났으면 fetch() 로 읽어 다시 만듦)
+
+        비활성화(ttl <= 0)되어 있으면 매 요청 새로 만든다.
+        """
+        value = self.current()
+        if value is not None:
+            return value
+        if not self.enabled:
+            return await self._load(fetch)
+        previous = self.latest()
+        if previous is not None and self.refresh_lock.locked():
+            return previous
+
+        async with self.refresh_lock:
+            # 기다리는 동안 다른 요청이 이미 다시 읽었을 수 있음
+            value = self.current()
+            if value is None:
+                value = await self._load(fetch)
+        return value
+
+    async def _load(self, fetch: Callable[[], Awaitable[Any]]) -> T:
+        token = self._changes
+        value = await run_in_threadpool(self.build, await fetch())
+        with self._lock:
+            if self.enabled and self._changes == token:
+                self._value = value
+                self._loaded_at = time.time()
+        return value
+
+    def apply(self, change: Callable[[T], Optional[T]]):
+        """현재 값에 변경 적용 (change 가 새 값을 반환하면 교체, None 이면 제자리 수정)"""
+        with self._lock:
+            self._changes += 1
+            if self._value is not None:
+                updated = change(self._value)
+                if updated is not None:
+                    self._value = updated
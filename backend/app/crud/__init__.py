@@ -1,198 +1,736 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from app.models.user import User, MatchRequest
+from sqlalchemy.orm import Session, load_only, contains_eager
+from sqlalchemy import and_, or_, select, func, insert, update, literal
+from sqlalchemy.exc import IntegrityError
+from app.models.user import User, MatchRequest, MentorSkill
 from app.schemas.user import SignupRequest, UpdateMentorProfileRequest, UpdateMenteeProfileRequest, MatchRequestCreate
 from app.core.security import get_password_hash
+from app.storage import get_image_storage
+from app.storage.renditions import create_renditions
+from app.core.cache import user_cache
+from app.core.directory import mentor_directory, MentorEntry, skill_sort_key
+from app.core.recommend import mentor_recommender
+from app.db.search import search_terms, sync_mentor_document, mentor_search_subquery
+from app.core.pagination import DEFAULT_PAGE_SIZE, encode_cursor, decode_cursor, column_types, keyset_after, keyset_before
 import base64
-from typing import Optional, List
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Tuple, Union
 from PIL import Image
 import io
 
+# 프로필 응답/인증에 필요한 컬럼 (이미지 바이너리 제외)
+PROFILE_COLUMNS = (User.id, User.email, User.name, User.role, User.bio, User.skills, User.image_hash)
+LOGIN_COLUMNS = (User.id, User.email, User.name, User.role, User.password_hash)
+
 # 사용자 관련 CRUD
 def get_user_by_email(db: Session, email: str):
-    return db.query(User).filter(User.email == email).first()
+    return db.query(User).options(load_only(*LOGIN_COLUMNS)).filter(User.email == email).first()
 
 def get_user_by_id(db: Session, user_id: int):
-    return db.query(User).filter(User.id == user_id).first()
+    return db.query(User).options(load_only(*PROFILE_COLUMNS)).filter(User.id == user_id).first()
+
+# 목록/요청 상대방에 보여주는 최소 프로필 컬럼
+USER_SUMMARY_COLUMNS = (User.id, User.name, User.role, User.image_hash)
+
+def get_user_summaries(db: Session, viewer_id: int, user_ids: List[int]):
+    """
+    여러 사용자의 최소 프로필을 한 번의 IN 쿼리로 조회
+    
+    조회하는 사용자 본인, 멘토, 그리고 조회하는 사용자와 매칭 요청으로 연결된 사용자만 반환한다.
+    """
+    connected = select(MatchRequest.id).where(
+        or_(
+            and_(MatchRequest.mentor_id == viewer_id, MatchRequest.mentee_id == User.id),
+            and_(MatchRequest.mentee_id == viewer_id, MatchRequest.mentor_id == User.id)
+        )
+    ).exists()
+    
+    return db.query(*USER_SUMMARY_COLUMNS).filter(
+        User.id.in_(user_ids),
+        or_(User.id == viewer_id, User.role == "mentor", connected)
+    ).all()
+
+def get_profile_image(db: Session, user_id: int):
+    """(role, image_hash, image_mime, image_updated_at) 만 조회"""
+    return db.query(User.role, User.image_hash, User.image_mime, User.image_updated_at).filter(User.id == user_id).first()
 
-def create_user(db: Session, user: SignupRequest):
-    hashed_password = get_password_hash(user.password)
+def create_user(db: Session, user: SignupRequest, hashed_password: Optional[str] = None):
+    # 해시를 미리 계산해 넘기지 않은 경우에만 여기서 해싱
+    if hashed_password is None:
+        hashed_password = get_password_hash(user.password)
     db_user = User(
         email=user.email,
         password_hash=hashed_password,
         name=user.name,
         role=user.role,
         bio="",
-        skills=[] if user.role == "mentor" else None
+        skills=[] if user.role == "mentor" else None,
+        skill_sort_key=""
     )
     db.add(db_user)
+    if db_user.role == "mentor":
+        db.flush()
+        sync_mentor_document(db, db_user.id, db_user.name, db_user.bio, db_user.skills)
     db.commit()
     db.refresh(db_user)
+    if db_user.role == "mentor":
+        mentor_directory.upsert(MentorEntry.from_user(db_user))
+        mentor_recommender.upsert(db_user.id, db_user.skills)
     return db_user
 
-def update_user_profile(db: Session, user: User, profile_data):
+def store_profile_image(image_base64: str) -> Tuple[str, str]:
+    """
+    Base64 프로필 이미지를 검증해 이미지 저장소에 원본과 썸네일을 저장하고 (해시, MIME) 반환
+    
+    이미지 디코딩/리사이즈/인코딩은 CPU 를 오래 쓰므로 비동기 경로에서는
+    app.crud.aio.store_profile_image 로 스레드 풀에서 실행한 뒤 결과만 update_user_profile 에 넘긴다.
+    """
+    try:
+        # Base64 디코딩
+        image_data = base64.b64decode(image_base64)
+        
+        # 파일 크기 검증 (1MB = 1024 * 1024 bytes)
+        if len(image_data) > 1024 * 1024:
+            raise ValueError("이미지 파일 크기는 1MB를 초과할 수 없습니다")
+        
+        # 이미지 형식 및 크기 검증
+        image = Image.open(io.BytesIO(image_data))
+        
+        # 형식 검증 (.jpg, .png만 허용)
+        if image.format not in ['JPEG', 'PNG']:
+            raise ValueError("이미지 형식은 JPG 또는 PNG만 허용됩니다")
+        
+        # 이미지 크기 검증 (500x500 ~ 1000x1000)
+        width, height = image.size
+        if width < 500 or height < 500 or width > 1000 or height > 1000:
+            raise ValueError("이미지 크기는 500x500 ~ 1000x1000 픽셀이어야 합니다")
+        
+        # 정사각형 검증
+        if width != height:
+            raise ValueError("이미지는 정사각형이어야 합니다")
+        
+        # 이미지 저장소에 내용 해시로 저장 (사용자에는 해시와 형식만 기록)
+        storage = get_image_storage()
+        image_hash = storage.save(image_data)
+        create_renditions(storage, image_hash, image)
+        return image_hash, "image/png" if image.format == "PNG" else "image/jpeg"
+    except ValueError as e:
+        # 검증 오류는 다시 발생시켜서 API에서 처리하도록
+        raise e
+    except Exception:
+        raise ValueError("이미지 처리 중 오류가 발생했습니다")
+
+def update_user_profile(db: Session, user: User, profile_data, image: Optional[Tuple[str, str]] = None):
+    """프로필 수정 (image 는 store_profile_image 로 미리 저장한 (해시, MIME), 없으면 여기서 처리)"""
     user.name = profile_data.name
     user.bio = profile_data.bio
     
-    # Base64 이미지 디코딩 및 검증 (빈 문자열이 아닌 경우만)
-    if profile_data.image and profile_data.image.strip():
-        try:
-            # Base64 디코딩
-            image_data = base64.b64decode(profile_data.image)
-            
-            # 파일 크기 검증 (1MB = 1024 * 1024 bytes)
-            if len(image_data) > 1024 * 1024:
-                raise ValueError("이미지 파일 크기는 1MB를 초과할 수 없습니다")
-            
-            # 이미지 형식 및 크기 검증
-            image = Image.open(io.BytesIO(image_data))
-            
-            # 형식 검증 (.jpg, .png만 허용)
-            if image.format not in ['JPEG', 'PNG']:
-                raise ValueError("이미지 형식은 JPG 또는 PNG만 허용됩니다")
-            
-            # 이미지 크기 검증 (500x500 ~ 1000x1000)
-            width, height = image.size
-            if width < 500 or height < 500 or width > 1000 or height > 1000:
-                raise ValueError("이미지 크기는 500x500 ~ 1000x1000 픽셀이어야 합니다")
-            
-            # 정사각형 검증
-            if width != height:
-                raise ValueError("이미지는 정사각형이어야 합니다")
-            
-            user.profile_image = image_data
-        except ValueError as e:
-            # 검증 오류는 다시 발생시켜서 API에서 처리하도록
-            raise e
-        except Exception:
-            raise ValueError("이미지 처리 중 오류가 발생했습니다")
+    # 이미지가 있는 경우만 (빈 문자열 제외)
+    if image is None and profile_data.image and profile_data.image.strip():
+        image = store_profile_image(profile_data.image)
+    if image is not None:
+        user.image_hash, user.image_mime = image
+        user.image_updated_at = datetime.now(timezone.utc)
+        user.profile_image = None
     
     if hasattr(profile_data, 'skills'):
         user.skills = profile_data.skills
+        user.skill_sort_key = skill_sort_key(profile_data.skills)
+        sync_mentor_skills(db, user.id, profile_data.skills)
+    
+    if user.role == "mentor":
+        sync_mentor_document(db, user.id, user.name, user.bio, user.skills)
     
     db.commit()
     db.refresh(user)
+    user_cache.invalidate(user.id)
+    if user.role == "mentor":
+        mentor_directory.upsert(MentorEntry.from_user(user))
+        mentor_recommender.upsert(user.id, user.skills)
     return user
 
 # 멘토 관련 CRUD
-def get_mentors(db: Session, skill: Optional[str] = None, order_by: Optional[str] = None):
-    query = db.query(User).filter(User.role == "mentor")
+def sync_mentor_skills(db: Session, user_id: int, skills: Optional[List[str]]):
+    """mentor_skills 테이블을 users.skills 와 동일하게 맞춤 (커밋은 호출자가 수행)"""
+    db.query(MentorSkill).filter(MentorSkill.user_id == user_id).delete(synchronize_session=False)
+    
+    # 중복 스킬은 한 번만 저장 (user_id, skill 이 기본키)
+    for skill in dict.fromkeys(skills or []):
+        db.add(MentorSkill(user_id=user_id, skill=skill))
+
+def parse_skill_filter(skill: Optional[Union[str, List[str]]]) -> List[str]:
+    """쉼표로 구분된 스킬 문자열 또는 리스트를 스킬 목록으로 변환"""
+    if not skill:
+        return []
+    if isinstance(skill, str):
+        skill = skill.split(",")
+    return list(dict.fromkeys(s.strip() for s in skill if s and s.strip()))
+
+def mentor_ids_with_skills(skills: List[str], match_all: bool = False):
+    """주어진 스킬을 가진 멘토 ID 서브쿼리 (ix_mentor_skills_skill_user_id 사용)"""
+    query = select(MentorSkill.user_id).where(MentorSkill.skill.in_(skills))
+    if match_all and len(skills) > 1:
+        # 모든 스킬을 가진 멘토만 (AND)
+        query = query.group_by(MentorSkill.user_id).having(func.count() == len(skills))
+    return query
+
+# 멘토 목록 응답에 필요한 컬럼 (+ 키셋 커서를 만들 정렬 키)
+MENTOR_LIST_COLUMNS = (
+    User.id, User.email, User.name, User.bio, User.skills, User.image_hash,
+    User.skill_sort_key, User.pending_request_count
+)
+
+def _mentor_query(
+    db: Session,
+    skill: Optional[Union[str, List[str]]] = None,
+    match_all: bool = False,
+    available: Optional[bool] = None
+):
+    query = db.query(User).options(load_only(*MENTOR_LIST_COLUMNS)).filter(User.role == "mentor")
     
-    if skill:
-        # JSON 배열에서 특정 스킬 검색
-        query = query.filter(User.skills.contains(f'"{skill}"'))
+    skills = parse_skill_filter(skill)
+    if skills:
+        # 정규화된 mentor_skills 인덱스로 스킬 검색 (여러 스킬은 기본 OR, match_all 이면 AND)
+        query = query.filter(User.id.in_(mentor_ids_with_skills(skills, match_all)))
+    
+    # 수락된 요청이 없는 멘토만 매칭 가능 (비정규화된 accepted_request_count 로 판단)
+    if available is not None:
+        query = query.filter(
+            User.accepted_request_count == 0 if available else User.accepted_request_count > 0
+        )
+    
+    return query
+
+# order_by 외의 정렬 (sort 파라미터)
+MENTOR_SORTS = ("least_busy",)
+
+def _mentor_order_mode(order_by: Optional[str], sort: Optional[str]) -> Optional[str]:
+    if sort is None:
+        return order_by
+    if sort not in MENTOR_SORTS:
+        raise ValueError(f"알 수 없는 정렬입니다: {sort}")
+    if order_by:
+        raise ValueError("order_by 와 sort 는 함께 사용할 수 없습니다")
+    return sort
+
+def _mentor_search(db: Session, q: str, order_by: Optional[str]):
+    """전문 검색 서브쿼리 (검색 결과는 항상 관련도 순)"""
+    if order_by:
+        raise ValueError("검색어(q)와 order_by 는 함께 사용할 수 없습니다")
+    terms = search_terms(q)
+    if not terms:
+        raise ValueError("검색어를 입력해주세요")
+    return mentor_search_subquery(db, terms)
+
+def get_mentors(
+    db: Session,
+    skill: Optional[Union[str, List[str]]] = None,
+    order_by: Optional[str] = None,
+    match_all: bool = False,
+    q: Optional[str] = None,
+    available: Optional[bool] = None,
+    sort: Optional[str] = None
+):
+    order_by = _mentor_order_mode(order_by, sort)
+    query = _mentor_query(db, skill, match_all, available)
     
-    if order_by == "name":
-        query = query.order_by(User.name)
-    elif order_by == "skill":
-        query = query.order_by(User.skills)
+    if q is not None:
+        # 검색 인덱스에서 일치하는 멘토만 JOIN 하고 관련도 순으로 정렬
+        search = _mentor_search(db, q, order_by)
+        query = query.join(search, search.c.user_id == User.id).order_by(search.c.rank, User.id)
     else:
-        query = query.order_by(User.id)
+        # 키셋 페이지와 같은 정렬 (정렬 키 인덱스 사용)
+        query = query.order_by(*MENTOR_KEYSET_COLUMNS[order_by or "id"])
     
     return query.all()
 
-# 매칭 요청 관련 CRUD
-def create_match_request(db: Session, request_data: MatchRequestCreate):
-    # 멘티가 이미 pending 상태의 요청을 가지고 있는지 확인
-    existing_pending_request = db.query(MatchRequest).filter(
-        and_(
-            MatchRequest.mentee_id == request_data.menteeId,
-            MatchRequest.status == "pending"
-        )
-    ).first()
+# 디렉터리 스냅샷 항목 (app.core.directory.MentorEntry) 에 필요한 컬럼
+MENTOR_ENTRY_COLUMNS = (User.id, User.email, User.name, User.bio, User.skills, User.image_hash)
+
+def get_mentor_directory_rows(db: Session):
+    """디렉터리 전체 로드용 멘토 행 (ORM 객체를 만들지 않고 컬럼 값만 조회)"""
+    return db.execute(select(*MENTOR_ENTRY_COLUMNS).where(User.role == "mentor")).all()
+
+def get_mentors_by_ids(db: Session, mentor_ids: List[int]):
+    """여러 멘토의 목록용 컬럼만 한 번의 IN 쿼리로 조회"""
+    return _mentor_query(db).filter(User.id.in_(mentor_ids)).all()
+
+# 커서 페이지네이션이 가능한 정렬 모드별 키 (마지막은 항상 유일한 id)
+MENTOR_KEYSET_COLUMNS = {
+    "id": (User.id,),
+    "name": (User.name, User.id),
+    "skill": (User.skill_sort_key, User.name, User.id),
+    "least_busy": (User.pending_request_count, User.id),
+}
+
+def get_mentors_page(
+    db: Session,
+    skill: Optional[Union[str, List[str]]] = None,
+    order_by: Optional[str] = None,
+    match_all: bool = False,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    q: Optional[str] = None,
+    available: Optional[bool] = None,
+    sort: Optional[str] = None
+):
+    """키셋 페이지네이션으로 멘토 한 페이지와 다음 페이지 커서를 반환"""
+    order_by = _mentor_order_mode(order_by, sort)
+    if q is not None:
+        return _search_mentors_page(db, q, skill, order_by, match_all, available, limit, cursor)
+    
+    mode = order_by or "id"
+    columns = MENTOR_KEYSET_COLUMNS.get(mode)
+    if columns is None:
+        raise ValueError(f"order_by={mode} 는 커서 페이지네이션을 지원하지 않습니다")
+    
+    query = _mentor_query(db, skill, match_all, available)
+    if cursor:
+        query = query.filter(keyset_after(columns, decode_cursor(cursor, mode, len(columns), column_types(columns))))
+    
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+    mentors = query.order_by(*columns).limit(limit + 1).all()
+    
+    next_cursor = None
+    if len(mentors) > limit:
+        mentors = mentors[:limit]
+        last = mentors[-1]
+        next_cursor = encode_cursor(mode, [getattr(last, column.key) for column in columns])
     
-    if existing_pending_request:
-        return None  # 이미 pending 요청이 있음
+    return mentors, next_cursor
+
+def _search_mentors_page(
+    db: Session,
+    q: str,
+    skill: Optional[Union[str, List[str]]],
+    order_by: Optional[str],
+    match_all: bool,
+    available: Optional[bool],
+    limit: int,
+    cursor: Optional[str]
+):
+    """검색 결과를 (관련도, id) 키셋으로 페이지네이션"""
+    search = _mentor_search(db, q, order_by)
+    columns = (search.c.rank, User.id)
+    
+    query = _mentor_query(db, skill, match_all, available).join(search, search.c.user_id == User.id).add_columns(search.c.rank)
+    if cursor:
+        query = query.filter(keyset_after(columns, decode_cursor(cursor, "rank", len(columns), column_types(columns))))
+    
+    rows = query.order_by(*columns).limit(limit + 1).all()
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last, rank = rows[-1]
+        next_cursor = encode_cursor("rank", [rank, last.id])
     
-    # 같은 멘토에게 pending 상태의 요청이 있는지만 확인 (거절/취소된 경우는 재요청 가능)
-    existing_pending_to_mentor = db.query(MatchRequest).filter(
-        and_(
-            MatchRequest.mentor_id == request_data.mentorId,
-            MatchRequest.mentee_id == request_data.menteeId,
-            MatchRequest.status == "pending"
+    return [mentor for mentor, _ in rows], next_cursor
+
+# 매칭 요청 관련 CRUD
+
+# 세션에 모아 두는 상태 변경 목록 키 (app.crud.aio 가 호출 후 꺼내 이벤트로 발행)
+MATCH_REQUEST_CHANGES_KEY = "match_request_changes"
+
+def record_match_request_change(db: Session, request):
+    """상태가 바뀐 매칭 요청을 (id, mentor_id, mentee_id, status) 로 세션에 기록"""
+    db.info.setdefault(MATCH_REQUEST_CHANGES_KEY, []).append(
+        (request.id, request.mentor_id, request.mentee_id, request.status)
+    )
+
+def _shift_mentor_request_counts(db: Session, mentor_id: int, pending: int = 0, accepted: int = 0) -> Optional[int]:
+    """
+    멘토의 pending/accepted 요청 수를 증감 (커밋은 호출자가 수행)
+    
+    요청 상태 변경과 같은 트랜잭션에서 UPDATE ... SET n = n + delta 로 갱신하므로
+    동시에 바뀌어도 값이 어긋나지 않는다. 변경 후의 수락된 요청 수를 반환한다 (변경이 없으면 None).
+    """
+    if not pending and not accepted:
+        return None
+    return db.execute(
+        update(User)
+        .where(User.id == mentor_id)
+        .values(
+            pending_request_count=User.pending_request_count + pending,
+            accepted_request_count=User.accepted_request_count + accepted
         )
+        .returning(User.accepted_request_count)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+
+def _status_change_counts(old_status: Optional[str], new_status: str) -> dict:
+    """요청 상태가 old_status -> new_status 로 바뀔 때의 카운터 증감"""
+    return {
+        "pending": (new_status == "pending") - (old_status == "pending"),
+        "accepted": (new_status == "accepted") - (old_status == "accepted"),
+    }
+
+def _sync_mentor_availability(mentor_id: int, accepted_count: Optional[int]):
+    # 커밋 후 추천 행렬의 매칭 가능 여부 갱신
+    if accepted_count is not None:
+        mentor_recommender.set_available(mentor_id, accepted_count == 0)
+
+# 상태 변경 UPDATE ... RETURNING 으로 돌려받는 컬럼 (API 응답에 필요한 값)
+MATCH_REQUEST_RETURNING_COLUMNS = (
+    MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id, MatchRequest.message, MatchRequest.status
+)
+
+def _update_match_request_status(db: Session, request_id: int, old_status: str, new_status: str):
+    """
+    요청 상태를 old_status 일 때만 new_status 로 바꾸고 멘토 카운터를 같은 트랜잭션에서 갱신
+    
+    UPDATE ... WHERE status = :old 가 행을 바꾼 경우에만 카운터를 움직이므로
+    같은 요청을 동시에 처리해도 한쪽만 반영된다. (변경된 행 또는 None, 수락된 요청 수) 를 반환한다.
+    """
+    request = db.execute(
+        update(MatchRequest)
+        .where(and_(MatchRequest.id == request_id, MatchRequest.status == old_status))
+        .values(status=new_status)
+        .returning(*MATCH_REQUEST_RETURNING_COLUMNS)
+        .execution_options(synchronize_session=False)
     ).first()
+    if request is None:
+        return None, None
+    return request, _shift_mentor_request_counts(
+        db, request.mentor_id, **_status_change_counts(old_status, new_status)
+    )
+
+def _change_match_request_status(db: Session, request_id: int, owner_column, owner_id: int, new_status: str):
+    """
+    owner 의 요청 하나를 현재 상태와 관계없이 new_status 로 변경 (커밋은 호출자가 수행)
+    
+    읽은 상태가 UPDATE 전에 다른 요청에 의해 바뀌었으면 다시 읽어서 시도한다.
+    (요청 또는 None, 바뀐 행인지, 수락된 요청 수) 를 반환한다.
+    """
+    while True:
+        current = db.execute(
+            select(*MATCH_REQUEST_RETURNING_COLUMNS).where(
+                and_(MatchRequest.id == request_id, owner_column == owner_id)
+            )
+        ).first()
+        if current is None or current.status == new_status:
+            return current, False, None
+        
+        request, accepted_count = _update_match_request_status(db, request_id, current.status, new_status)
+        if request is not None:
+            return request, True, accepted_count
+
+def create_match_request(db: Session, request_data: MatchRequestCreate):
+    """
+    매칭 요청을 단일 INSERT ... SELECT 문으로 생성
     
-    if existing_pending_to_mentor:
-        return None  # 이미 해당 멘토에게 pending 요청이 있음
+    멘토 존재 여부는 같은 문장의 WHERE EXISTS 로, 멘티당 pending 하나 제약은
+    uq_match_requests_mentee_pending 유니크 인덱스로 DB 가 원자적으로 보장한다.
+    생성할 수 없으면 사유를 담은 ValueError 를 발생시킨다 (어느 쪽이 없는지는 실패한 경우에만 다시 조회).
+    """
+    requests = MatchRequest.__table__
+    mentor_exists = select(User.id).where(
+        and_(User.id == request_data.mentorId, User.role == "mentor")
+    ).exists()
+    # 토큰만 검사하는 경로(AUTH_MODE=stateless)에서도 DB 에 없는 멘티의 요청이 생기지 않도록 멘티도 같은 문장에서 확인
+    mentee_exists = select(User.id).where(
+        and_(User.id == request_data.menteeId, User.role == "mentee")
+    ).exists()
     
-    # 새 요청 생성
-    new_request = MatchRequest(
-        mentor_id=request_data.mentorId,
-        mentee_id=request_data.menteeId,
-        message=request_data.message,
-        status="pending"
+    statement = insert(requests).from_select(
+        ["mentor_id", "mentee_id", "message", "status", "updated_at"],
+        select(
+            literal(request_data.mentorId),
+            literal(request_data.menteeId),
+            literal(request_data.message),
+            literal("pending"),
+            func.now()
+        ).where(and_(mentor_exists, mentee_exists))
+    ).returning(
+        requests.c.id, requests.c.mentor_id, requests.c.mentee_id,
+        requests.c.message, requests.c.status
     )
-    db.add(new_request)
+    
+    try:
+        new_request = db.execute(statement).first()
+    except IntegrityError:
+        # 멘티에게 이미 pending 요청이 있음 (같은 멘토 포함)
+        db.rollback()
+        raise ValueError("이미 대기 중인 요청이 있습니다. 응답을 받거나 취소한 후 새로운 요청을 보내주세요.")
+    
+    if new_request is None:
+        db.rollback()
+        if not db.execute(select(mentor_exists)).scalar():
+            raise ValueError("멘토를 찾을 수 없습니다")
+        raise ValueError("멘티를 찾을 수 없습니다")
+    
+    _shift_mentor_request_counts(db, new_request.mentor_id, pending=1)
     db.commit()
-    db.refresh(new_request)
+    record_match_request_change(db, new_request)
     return new_request
 
-def get_incoming_match_requests(db: Session, mentor_id: int):
-    # 모든 상태의 요청 반환 (API 명세에 따라)
-    return db.query(MatchRequest).filter(MatchRequest.mentor_id == mentor_id).all()
+MATCH_REQUEST_STATUSES = ("pending", "accepted", "rejected", "cancelled")
+
+# 요청 피드 정렬 키 (최신순, 같은 시각이면 ID 역순)
+MATCH_REQUEST_KEYSET_COLUMNS = (MatchRequest.created_at, MatchRequest.id)
+
+def parse_status_filter(status: Optional[Union[str, List[str]]]) -> List[str]:
+    """쉼표로 구분된 상태 필터를 목록으로 변환 (알 수 없는 상태는 ValueError)"""
+    if not status:
+        return []
+    values = status if isinstance(status, list) else status.split(",")
+    statuses = [value.strip() for value in values if value.strip()]
+    invalid = [value for value in statuses if value not in MATCH_REQUEST_STATUSES]
+    if invalid:
+        raise ValueError(f"알 수 없는 요청 상태입니다: {', '.join(invalid)}")
+    return statuses
+
+def _timestamp_param(db: Session, value: datetime):
+    """
+    타임스탬프 컬럼과 비교할 값
+    
+    SQLite 의 CURRENT_TIMESTAMP 는 'YYYY-MM-DD HH:MM:SS' (UTC) 문자열로 저장되므로
+    같은 형식으로 맞춰야 문자열 비교가 시각 비교와 일치한다.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    if db.get_bind().dialect.name == "sqlite":
+        return func.datetime(value.replace(tzinfo=None))
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+def get_match_request_feed_as_of(db: Session, overlap_seconds: float) -> datetime:
+    """
+    다음 updatedSince 조회에 쓸 기준 시각 (같은 세션의 DB 시계 - overlap_seconds)
+    
+    애플리케이션 시계 대신 조회하는 DB(복제본일 수 있음)의 시계를 쓰고 overlap_seconds 만큼 앞당겨,
+    복제 지연이나 먼저 시작한 쓰기 트랜잭션 때문에 이번 조회에 보이지 않았던 변경이
+    다음 조회에 다시 포함되도록 한다 (겹치는 요청은 클라이언트가 ID 로 중복 제거).
+    """
+    now = db.execute(select(func.now())).scalar()
+    # SQLite 의 CURRENT_TIMESTAMP 는 시간대 없는 UTC
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return now - timedelta(seconds=overlap_seconds)
+
+# 피드 주인 컬럼 -> 상대방 관계 (받은 요청은 멘티, 보낸 요청은 멘토)
+COUNTERPART_RELATIONSHIPS = {
+    "mentor_id": MatchRequest.mentee,
+    "mentee_id": MatchRequest.mentor,
+}
+
+def _match_request_query(
+    db: Session,
+    owner_column,
+    user_id: int,
+    status: Optional[Union[str, List[str]]] = None,
+    updated_since: Optional[datetime] = None,
+    expand_counterpart: bool = False
+):
+    query = db.query(MatchRequest).filter(owner_column == user_id)
+    
+    # 상대방 최소 프로필을 같은 SQL 에서 JOIN 으로 함께 로드 (요청마다 추가 조회 없음)
+    if expand_counterpart:
+        counterpart = COUNTERPART_RELATIONSHIPS[owner_column.key]
+        query = query.join(counterpart).options(
+            contains_eager(counterpart).load_only(*USER_SUMMARY_COLUMNS)
+        )
+    
+    statuses = parse_status_filter(status)
+    if statuses:
+        query = query.filter(MatchRequest.status.in_(statuses))
+    
+    # 같은 초에 바뀐 요청을 놓치지 않도록 경계 포함 (클라이언트는 ID 로 중복 제거)
+    if updated_since is not None:
+        query = query.filter(MatchRequest.updated_at >= _timestamp_param(db, updated_since))
+    
+    return query
+
+def _match_requests_page(
+    db: Session,
+    owner_column,
+    user_id: int,
+    status: Optional[Union[str, List[str]]],
+    updated_since: Optional[datetime],
+    limit: int,
+    cursor: Optional[str],
+    expand_counterpart: bool
+):
+    query = _match_request_query(db, owner_column, user_id, status, updated_since, expand_counterpart)
+    if cursor:
+        # created_at 은 ISO 문자열로, request_id 는 정수로 담겨 있어야 함
+        created_at, request_id = decode_cursor(cursor, "created_at", len(MATCH_REQUEST_KEYSET_COLUMNS), (str, int))
+        try:
+            created_at = datetime.fromisoformat(created_at)
+        except (TypeError, ValueError):
+            raise ValueError("잘못된 커서입니다")
+        query = query.filter(
+            keyset_before(MATCH_REQUEST_KEYSET_COLUMNS, (_timestamp_param(db, created_at), request_id))
+        )
+    
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+    requests = query.order_by(*(column.desc() for column in MATCH_REQUEST_KEYSET_COLUMNS)).limit(limit + 1).all()
+    
+    next_cursor = None
+    if len(requests) > limit:
+        requests = requests[:limit]
+        last = requests[-1]
+        next_cursor = encode_cursor("created_at", [last.created_at.isoformat(), last.id])
+    
+    return requests, next_cursor
+
+def get_incoming_match_requests(
+    db: Session,
+    mentor_id: int,
+    status: Optional[Union[str, List[str]]] = None,
+    expand_counterpart: bool = False
+):
+    # 모든 상태의 요청 반환 (API 명세에 따라, status 로 필터 가능)
+    return _match_request_query(
+        db, MatchRequest.mentor_id, mentor_id, status, expand_counterpart=expand_counterpart
+    ).all()
 
-def get_outgoing_match_requests(db: Session, mentee_id: int):
-    return db.query(MatchRequest).filter(MatchRequest.mentee_id == mentee_id).all()
+def get_outgoing_match_requests(
+    db: Session,
+    mentee_id: int,
+    status: Optional[Union[str, List[str]]] = None,
+    expand_counterpart: bool = False
+):
+    return _match_request_query(
+        db, MatchRequest.mentee_id, mentee_id, status, expand_counterpart=expand_counterpart
+    ).all()
+
+def get_incoming_match_requests_page(
+    db: Session,
+    mentor_id: int,
+    status: Optional[Union[str, List[str]]] = None,
+    updated_since: Optional[datetime] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    expand_counterpart: bool = False
+):
+    """받은 요청을 최신순 키셋 페이지로 반환 (updated_since 이후 변경분만 조회 가능)"""
+    return _match_requests_page(
+        db, MatchRequest.mentor_id, mentor_id, status, updated_since, limit, cursor, expand_counterpart
+    )
+
+def get_outgoing_match_requests_page(
+    db: Session,
+    mentee_id: int,
+    status: Optional[Union[str, List[str]]] = None,
+    updated_since: Optional[datetime] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    expand_counterpart: bool = False
+):
+    """보낸 요청을 최신순 키셋 페이지로 반환 (updated_since 이후 변경분만 조회 가능)"""
+    return _match_requests_page(
+        db, MatchRequest.mentee_id, mentee_id, status, updated_since, limit, cursor, expand_counterpart
+    )
 
 def get_match_request_by_id(db: Session, request_id: int):
     return db.query(MatchRequest).filter(MatchRequest.id == request_id).first()
 
 def accept_match_request(db: Session, request_id: int, mentor_id: int):
-    # 해당 요청 찾기
-    request = db.query(MatchRequest).filter(
-        and_(
-            MatchRequest.id == request_id,
-            MatchRequest.mentor_id == mentor_id
-        )
-    ).first()
-    
+    # 해당 요청을 수락
+    request, changed, accepted_count = _change_match_request_status(
+        db, request_id, MatchRequest.mentor_id, mentor_id, "accepted"
+    )
     if not request:
         return None
     
     # 멘토의 다른 모든 요청을 거절 처리
-    db.query(MatchRequest).filter(
-        and_(
-            MatchRequest.mentor_id == mentor_id,
-            MatchRequest.id != request_id,
-            MatchRequest.status == "pending"
-        )
-    ).update({"status": "rejected"})
-    
-    # 해당 요청을 수락
-    request.status = "accepted"
+    reject_other_pending_requests(db, mentor_id, request_id)
     db.commit()
-    db.refresh(request)
+    if changed:
+        record_match_request_change(db, request)
+    _sync_mentor_availability(mentor_id, accepted_count)
     return request
 
-def reject_match_request(db: Session, request_id: int, mentor_id: int):
-    request = db.query(MatchRequest).filter(
-        and_(
-            MatchRequest.id == request_id,
-            MatchRequest.mentor_id == mentor_id
+def get_mentor_recommendation_source(db: Session):
+    """추천 행렬 전체 로드용 (멘토 (id, skills) 목록, 수락된 요청이 있는 멘토 ID 집합)"""
+    mentors = db.query(User.id, User.skills, User.accepted_request_count).filter(User.role == "mentor").all()
+    return (
+        [(mentor.id, mentor.skills) for mentor in mentors],
+        {mentor.id for mentor in mentors if mentor.accepted_request_count > 0}
+    )
+
+def reject_other_pending_requests(db: Session, mentor_id: int, accepted_id: int):
+    """수락된 요청을 제외한 멘토의 pending 요청을 한 번의 UPDATE 로 거절"""
+    rejected = db.execute(
+        update(MatchRequest)
+        .where(
+            and_(
+                MatchRequest.mentor_id == mentor_id,
+                MatchRequest.id != accepted_id,
+                MatchRequest.status == "pending"
+            )
         )
-    ).first()
+        .values(status="rejected")
+        .returning(MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id, MatchRequest.status)
+    ).all()
     
+    for request in rejected:
+        record_match_request_change(db, request)
+    _shift_mentor_request_counts(db, mentor_id, pending=-len(rejected))
+
+def reject_match_request(db: Session, request_id: int, mentor_id: int):
+    request, changed, accepted_count = _change_match_request_status(
+        db, request_id, MatchRequest.mentor_id, mentor_id, "rejected"
+    )
     if not request:
         return None
     
-    request.status = "rejected"
     db.commit()
-    db.refresh(request)
+    if changed:
+        record_match_request_change(db, request)
+    _sync_mentor_availability(request.mentor_id, accepted_count)
     return request
 
 def cancel_match_request(db: Session, request_id: int, mentee_id: int):
-    request = db.query(MatchRequest).filter(
-        and_(
-            MatchRequest.id == request_id,
-            MatchRequest.mentee_id == mentee_id
-        )
-    ).first()
-    
+    request, changed, accepted_count = _change_match_request_status(
+        db, request_id, MatchRequest.mentee_id, mentee_id, "cancelled"
+    )
     if not request:
         return None
     
-    request.status = "cancelled"
     db.commit()
-    db.refresh(request)
-    return request
\ No newline at end of file
+    if changed:
+        record_match_request_change(db, request)
+    _sync_mentor_availability(request.mentor_id, accepted_count)
+    return request
+
+def apply_match_request_actions(db: Session, mentor_id: int, actions: List[tuple]):
+    """
+    멘토의 여러 요청에 (request_id, "accept" | "reject") 를 순서대로 한 트랜잭션으로 적용
+    
+    대상 요청 ID 는 한 번의 SELECT 로 확인하고, 각 항목은 pending 일 때만 바꾸는 조건부 UPDATE 로,
+    수락 시 나머지 pending 은 집합 UPDATE 로 거절한다.
+    pending 이 아닌 요청(앞선 수락으로 자동 거절되었거나 동시에 처리된 경우 포함)은 건너뛴다.
+    항목별로 (request_id, action, 변경된 상태 또는 None, 실패 사유 또는 None) 를 반환한다.
+    """
+    request_ids = {request_id for request_id, _ in actions}
+    owned_ids = set(db.execute(
+        select(MatchRequest.id).where(
+            and_(
+                MatchRequest.mentor_id == mentor_id,
+                MatchRequest.id.in_(request_ids)
+            )
+        )
+    ).scalars())
+    
+    results = []
+    accepted_count = None
+    for request_id, action in actions:
+        if request_id not in owned_ids:
+            results.append((request_id, action, None, "매칭 요청을 찾을 수 없습니다"))
+            continue
+        
+        new_status = "accepted" if action == "accept" else "rejected"
+        request, count = _update_match_request_status(db, request_id, "pending", new_status)
+        if request is None:
+            results.append((request_id, action, None, "이미 처리된 요청입니다"))
+            continue
+        
+        accepted_count = count
+        if action == "accept":
+            reject_other_pending_requests(db, mentor_id, request_id)
+        record_match_request_change(db, request)
+        results.append((request_id, action, request.status, None))
+    
+    db.commit()
+    _sync_mentor_availability(mentor_id, accepted_count)
+    return results
@@ -0,0 +1,153 @@
+"""
+app.crud 의 비동기 버전
+
+AsyncSession.run_sync 로 동기 CRUD 함수를 그대로 실행한다. 쿼리 로직은 app.crud 한 곳에만 두고,
+DB I/O 는 비동기 드라이버(aiosqlite/asyncpg)를 통해 이루어지므로 대기 중에 이벤트 루프가 막히지 않는다.
+반환된 객체는 필요한 컬럼이 모두 로드된 상태이므로 라우터에서 추가 로드 없이 사용할 수 있다.
+"""
+from datetime import datetime
+from typing import Optional, List, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app import crud
+from app.models.user import User
+from app.schemas.user import SignupRequest, MatchRequestCreate
+from app.core.pagination import DEFAULT_PAGE_SIZE
+from app.events import publish_match_request_changes
+from app.db.database import pin_primary
+
+# 사용자 관련 CRUD
+async def get_user_by_email(db: AsyncSession, email: str):
+    return await db.run_sync(crud.get_user_by_email, email)
+
+async def get_user_by_id(db: AsyncSession, user_id: int):
+    return await db.run_sync(crud.get_user_by_id, user_id)
+
+async def get_user_summaries(db: AsyncSession, viewer_id: int, user_ids: List[int]):
+    return await db.run_sync(crud.get_user_summaries, viewer_id, user_ids)
+
+async def get_profile_image(db: AsyncSession, user_id: int):
+    return await db.run_sync(crud.get_profile_image, user_id)
+
+async def create_user(db: AsyncSession, user: SignupRequest, hashed_password: Optional[str] = None):
+    return await db.run_sync(crud.create_user, user, hashed_password)
+
+async def store_profile_image(image_base64: str) -> Tuple[str, str]:
+    # 이미지 처리는 이벤트 루프를 막지 않도록 스레드 풀에서 실행
+    return await run_in_threadpool(crud.store_profile_image, image_base64)
+
+async def update_user_profile(db: AsyncSession, user: User, profile_data, image: Optional[Tuple[str, str]] = None):
+    return await db.run_sync(crud.update_user_profile, user, profile_data, image)
+
+# 멘토 관련 CRUD
+async def get_mentors(
+    db: AsyncSession,
+    skill: Optional[Union[str, List[str]]] = None,
+    order_by: Optional[str] = None,
+    match_all: bool = False,
+    q: Optional[str] = None,
+    available: Optional[bool] = None,
+    sort: Optional[str] = None
+):
+    return await db.run_sync(crud.get_mentors, skill, order_by, match_all, q, available, sort)
+
+async def get_mentors_page(
+    db: AsyncSession,
+    skill: Optional[Union[str, List[str]]] = None,
+    order_by: Optional[str] = None,
+    match_all: bool = False,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    q: Optional[str] = None,
+    available: Optional[bool] = None,
+    sort: Optional[str] = None
+):
+    return await db.run_sync(crud.get_mentors_page, skill, order_by, match_all, limit, cursor, q, available, sort)
+
+async def get_mentor_directory_rows(db: AsyncSession):
+    return await db.run_sync(crud.get_mentor_directory_rows)
+
+async def get_mentor_recommendation_source(db: AsyncSession):
+    return await db.run_sync(crud.get_mentor_recommendation_source)
+
+async def get_mentors_by_ids(db: AsyncSession, mentor_ids: List[int]):
+    return await db.run_sync(crud.get_mentors_by_ids, mentor_ids)
+
+# 매칭 요청 관련 CRUD
+async def _run_and_publish(db: AsyncSession, fn, *args):
+    """
+    상태를 바꾸는 CRUD 함수를 실행하고, 성공하면 기록된 변경을 이벤트로 발행
+    
+    발행 전에 바뀐 요청의 멘토와 멘티 모두의 읽기를 기본 DB 로 고정해,
+    이벤트를 받은 상대방이 바로 다시 조회해도 복제 지연 없이 변경을 본다.
+    """
+    try:
+        result = await db.run_sync(fn, *args)
+    finally:
+        changes = db.info.pop(crud.MATCH_REQUEST_CHANGES_KEY, [])
+    await pin_primary(*{user_id for _, mentor_id, mentee_id, _ in changes for user_id in (mentor_id, mentee_id)})
+    await publish_match_request_changes(changes)
+    return result
+
+async def create_match_request(db: AsyncSession, request_data: MatchRequestCreate):
+    return await _run_and_publish(db, crud.create_match_request, request_data)
+
+async def get_incoming_match_requests(
+    db: AsyncSession,
+    mentor_id: int,
+    status: Optional[Union[str, List[str]]] = None,
+    expand_counterpart: bool = False
+):
+    return await db.run_sync(crud.get_incoming_match_requests, mentor_id, status, expand_counterpart)
+
+async def get_outgoing_match_requests(
+    db: AsyncSession,
+    mentee_id: int,
+    status: Optional[Union[str, List[str]]] = None,
+    expand_counterpart: bool = False
+):
+    return await db.run_sync(crud.get_outgoing_match_requests, mentee_id, status, expand_counterpart)
+
+async def get_incoming_match_requests_page(
+    db: AsyncSession,
+    mentor_id: int,
+    status: Optional[Union[str, List[str]]] = None,
+    updated_since: Optional[datetime] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    expand_counterpart: bool = False
+):
+    return await db.run_sync(
+        crud.get_incoming_match_requests_page, mentor_id, status, updated_since, limit, cursor, expand_counterpart
+    )
+
+async def get_outgoing_match_requests_page(
+    db: AsyncSession,
+    mentee_id: int,
+    status: Optional[Union[str, List[str]]] = None,
+    updated_since: Optional[datetime] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    expand_counterpart: bool = False
+):
+    return await db.run_sync(
+        crud.get_outgoing_match_requests_page, mentee_id, status, updated_since, limit, cursor, expand_counterpart
+    )
+
+async def get_match_request_feed_as_of(db: AsyncSession, overlap_seconds: float) -> datetime:
+    return await db.run_sync(crud.get_match_request_feed_as_of, overlap_seconds)
+
+async def get_match_request_by_id(db: AsyncSession, request_id: int):
+    return await db.run_sync(crud.get_match_request_by_id, request_id)
+
+async def accept_match_request(db: AsyncSession, request_id: int, mentor_id: int):
+    return await _run_and_publish(db, crud.accept_match_request, request_id, mentor_id)
+
+async def reject_match_request(db: AsyncSession, request_id: int, mentor_id: int):
+    return await _run_and_publish(db, crud.reject_match_request, request_id, mentor_id)
+
+async def cancel_match_request(db: AsyncSession, request_id: int, mentee_id: int):
+    return await _run_and_publish(db, crud.cancel_match_request, request_id, mentee_id)
+
+async def apply_match_request_actions(db: AsyncSession, mentor_id: int, actions: List[tuple]):
+    return await _run_and_publish(db, crud.apply_match_request_actions, mentor_id, actions)
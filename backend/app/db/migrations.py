@@ -0,0 +1,279 @@
+"""
+데이터베이스 마이그레이션
+
+Base.metadata.create_all 은 새 테이블만 만들고 기존 테이블에는 손대지 않으므로
+기존 DB 에 필요한 컬럼 추가/인덱스 생성/데이터 백필은 여기서 순서대로 수행한다.
+적용된 버전은 schema_migrations 테이블에 기록되어 한 번만 실행된다.
+
+실행: python -m app.db.migrations [--vacuum]
+"""
+import os
+import sys
+from contextlib import contextmanager
+from sqlalchemy import inspect, text, func, select
+from sqlalchemy.engine import Connection, Engine
+from app.models.user import Base, User, MentorSkill, MatchRequest
+from app.storage import get_image_storage, detect_image_mime
+from app.storage.renditions import create_renditions_from_bytes
+from app.db.search import create_search_index, sync_mentor_document
+from app.core.directory import skill_sort_key
+
+MIGRATIONS = []
+
+# 다른 워커가 마이그레이션을 실행 중일 때 잠금을 기다리는 최대 시간(초, SQLite)
+MIGRATION_LOCK_TIMEOUT = float(os.getenv("MIGRATION_LOCK_TIMEOUT", "600"))
+# PostgreSQL advisory lock 키
+MIGRATION_LOCK_KEY = 0x6d656e74
+
+def migration(version: int, description: str):
+    """마이그레이션 함수 등록 데코레이터"""
+    def decorator(func):
+        MIGRATIONS.append((version, description, func))
+        return func
+    return decorator
+
+def _applied_versions(conn: Connection):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version INTEGER PRIMARY KEY, "
+        "description VARCHAR NOT NULL, "
+        "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    ))
+    return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+def _add_column(conn: Connection, column):
+    """기존 테이블에 모델의 컬럼이 없으면 추가"""
+    table = column.table
+    existing = {c["name"] for c in inspect(conn).get_columns(table.name)}
+    if column.name in existing:
+        return
+    column_type = column.type.compile(dialect=conn.dialect)
+    definition = f"{column.name} {column_type}"
+    # 상수 기본값이 있으면 기존 행도 그 값으로 채워지도록 함께 지정
+    if column.server_default is not None and isinstance(column.server_default.arg, str):
+        definition += f" DEFAULT '{column.server_default.arg}'"
+        if not column.nullable:
+            definition += " NOT NULL"
+    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {definition}"))
+
+def _create_indexes(conn: Connection, table, *names: str):
+    """모델의 인덱스 중 이름이 주어진 것만 생성 (이후 마이그레이션에서 추가되는 컬럼의 인덱스는 제외)"""
+    for index in table.indexes:
+        if index.name in names:
+            index.create(conn, checkfirst=True)
+
+@contextmanager
+def _locked_transaction(conn: Connection):
+    """다른 프로세스(워커)와 동시에 스키마를 바꾸지 않도록 쓰기 잠금을 잡은 트랜잭션"""
+    sqlite = conn.dialect.name == "sqlite"
+    if sqlite:
+        # 앞선 워커의 마이그레이션이 끝날 때까지 기다리도록 이 연결의 대기 시간만 늘림
+        busy_timeout = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+        conn.exec_driver_sql(f"PRAGMA busy_timeout={int(MIGRATION_LOCK_TIMEOUT * 1000)}")
+        conn.commit()
+    try:
+        with conn.begin():
+            if sqlite:
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+            elif conn.dialect.name == "postgresql":
+                conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            yield
+    finally:
+        if sqlite:
+            conn.exec_driver_sql(f"PRAGMA busy_timeout={busy_timeout}")
+            conn.commit()
+
+def run_migrations(engine: Engine):
+    """테이블을 만들고 아직 적용되지 않은 마이그레이션을 버전 순서대로 실행
+
+    여러 워커가 동시에 시작해도 잠금을 잡은 워커만 적용하고,
+    나머지는 잠금을 얻은 뒤 적용 여부를 다시 확인해 건너뛴다.
+    """
+    with engine.connect() as conn:
+        with _locked_transaction(conn):
+            Base.metadata.create_all(conn)
+            applied = _applied_versions(conn)
+
+    for version, description, func in sorted(MIGRATIONS, key=lambda m: m[0]):
+        if version in applied:
+            continue
+        # 마이그레이션 하나당 하나의 트랜잭션
+        with engine.connect() as conn:
+            with _locked_transaction(conn):
+                # 잠금을 기다리는 동안 다른 워커가 이미 적용했을 수 있음
+                if version in _applied_versions(conn):
+                    continue
+                func(conn)
+                conn.execute(
+                    text("INSERT INTO schema_migrations (version, description) VALUES (:version, :description)"),
+                    {"version": version, "description": description}
+                )
+
+# 1: mentor_skills 백필
+@migration(1, "backfill mentor_skills from users.skills")
+def backfill_mentor_skills(conn: Connection):
+    MentorSkill.__table__.create(conn, checkfirst=True)
+    for index in MentorSkill.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+    rows = conn.execute(
+        User.__table__.select()
+        .with_only_columns(User.id, User.skills)
+        .where(User.role == "mentor")
+    )
+    entries = [
+        {"user_id": user_id, "skill": skill}
+        for user_id, skills in rows
+        for skill in dict.fromkeys(skills or [])
+    ]
+
+    conn.execute(MentorSkill.__table__.delete())
+    if entries:
+        conn.execute(MentorSkill.__table__.insert(), entries)
+
+# 2: 멘토 목록 페이지네이션 인덱스
+@migration(2, "add users keyset pagination indexes")
+def add_user_pagination_indexes(conn: Connection):
+    _create_indexes(conn, User.__table__, "ix_users_role_id", "ix_users_role_name_id")
+
+# 3: 프로필 이미지를 users 테이블에서 이미지 저장소로 이동
+@migration(3, "move profile images to content-addressed storage")
+def move_profile_images(conn: Connection):
+    _add_column(conn, User.__table__.c.image_hash)
+    _add_column(conn, User.__table__.c.image_mime)
+
+    storage = get_image_storage()
+    users = User.__table__
+    user_ids = [row[0] for row in conn.execute(
+        users.select().with_only_columns(users.c.id).where(users.c.profile_image.isnot(None))
+    )]
+
+    # 이미지는 한 건씩 읽어서 메모리 사용량을 제한
+    for user_id in user_ids:
+        data = conn.execute(
+            users.select().with_only_columns(users.c.profile_image).where(users.c.id == user_id)
+        ).scalar()
+        conn.execute(
+            users.update().where(users.c.id == user_id).values(
+                image_hash=storage.save(data),
+                image_mime=detect_image_mime(data),
+                profile_image=None
+            )
+        )
+
+# 4: 이미지 Last-Modified 컬럼
+@migration(4, "add users.image_updated_at")
+def add_image_updated_at(conn: Connection):
+    _add_column(conn, User.__table__.c.image_updated_at)
+    users = User.__table__
+    conn.execute(
+        users.update()
+        .where(users.c.image_hash.isnot(None), users.c.image_updated_at.is_(None))
+        .values(image_updated_at=func.coalesce(users.c.updated_at, users.c.created_at))
+    )
+
+# 5: 기존 이미지의 썸네일 생성
+@migration(5, "generate profile image renditions")
+def generate_image_renditions(conn: Connection):
+    storage = get_image_storage()
+    users = User.__table__
+    hashes = conn.execute(
+        select(users.c.image_hash).where(users.c.image_hash.isnot(None)).distinct()
+    ).scalars().all()
+    for image_hash in hashes:
+        create_renditions_from_bytes(storage, image_hash, storage.get(image_hash))
+
+# 6: match_requests 복합 인덱스 + 멘티당 pending 하나 제약
+@migration(6, "add match_requests access pattern indexes")
+def add_match_request_indexes(conn: Connection):
+    requests = MatchRequest.__table__
+
+    # 유니크 인덱스 생성 전, 같은 멘티의 중복 pending 은 가장 최근 것만 남기고 취소 처리
+    latest_pending = (
+        select(func.max(requests.c.id))
+        .where(requests.c.status == "pending")
+        .group_by(requests.c.mentee_id)
+    )
+    conn.execute(
+        requests.update()
+        .where(requests.c.status == "pending", requests.c.id.not_in(latest_pending))
+        .values(status="cancelled")
+    )
+
+    for index in requests.indexes:
+        index.create(conn, checkfirst=True)
+
+# 7: 요청 피드 페이지네이션/변경분 조회용 인덱스 + updated_at 채우기
+@migration(7, "add match_requests feed indexes and backfill updated_at")
+def add_match_request_feed_indexes(conn: Connection):
+    requests = MatchRequest.__table__
+
+    # 한 번도 변경되지 않은 요청은 생성 시각을 변경 시각으로 사용
+    conn.execute(
+        requests.update()
+        .where(requests.c.updated_at.is_(None))
+        .values(updated_at=requests.c.created_at)
+    )
+
+    for index in requests.indexes:
+        index.create(conn, checkfirst=True)
+
+# 8: 멘토 전문 검색 인덱스 (SQLite FTS5 / PostgreSQL tsvector) 생성 + 백필
+@migration(8, "add mentor full-text search index")
+def add_mentor_search_index(conn: Connection):
+    create_search_index(conn)
+
+    mentors = conn.execute(
+        select(User.id, User.name, User.bio, User.skills).where(User.role == "mentor")
+    )
+    for mentor in mentors.all():
+        sync_mentor_document(conn, mentor.id, mentor.name, mentor.bio, mentor.skills)
+
+# 9: 멘토별 pending/accepted 요청 수 컬럼 + 백필
+@migration(9, "add users request count columns")
+def add_mentor_request_counts(conn: Connection):
+    users = User.__table__
+    requests = MatchRequest.__table__
+    _add_column(conn, users.c.pending_request_count)
+    _add_column(conn, users.c.accepted_request_count)
+
+    def count(status: str):
+        return (
+            select(func.count())
+            .where(requests.c.mentor_id == users.c.id, requests.c.status == status)
+            .scalar_subquery()
+        )
+
+    conn.execute(
+        users.update()
+        .where(users.c.role == "mentor")
+        .values(pending_request_count=count("pending"), accepted_request_count=count("accepted"))
+    )
+
+    _create_indexes(conn, users, "ix_users_role_accepted_pending_id", "ix_users_role_pending_id")
+
+# 10: 스킬순 정렬 키 컬럼 + 백필 + 인덱스
+@migration(10, "add users.skill_sort_key")
+def add_skill_sort_key(conn: Connection):
+    users = User.__table__
+    _add_column(conn, users.c.skill_sort_key)
+
+    mentors = conn.execute(
+        select(users.c.id, users.c.skills).where(users.c.role == "mentor")
+    ).all()
+    for mentor in mentors:
+        conn.execute(
+            users.update().where(users.c.id == mentor.id).values(skill_sort_key=skill_sort_key(mentor.skills))
+        )
+
+    _create_indexes(conn, users, "ix_users_role_skill_name_id")
+
+if __name__ == "__main__":
+    from app.db.database import engine
+
+    run_migrations(engine)
+
+    # --vacuum: 이미지를 옮긴 뒤 DB 파일 크기를 실제로 줄임 (SQLite)
+    if "--vacuum" in sys.argv and engine.dialect.name == "sqlite":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM"))
@@ -0,0 +1,76 @@
+"""
+read-your-writes 고정 저장소
+
+쓰기 직후 일정 시간 동안 해당 사용자의 읽기를 복제본 대신 기본 DB 로 보내기 위한 기록을 보관한다.
+READ_YOUR_WRITES_BACKEND 로 구현을 선택한다.
+- memory: 프로세스 메모리 (단일 워커 전용 - 다른 워커로 간 다음 요청은 복제본을 읽음)
+- redis: Redis 키 (모든 워커가 공유, requirements-redis.txt 필요)
+"""
+import os
+import threading
+import time
+from typing import Dict, Iterable
+
+READ_YOUR_WRITES_BACKEND = os.getenv("READ_YOUR_WRITES_BACKEND", "memory")
+READ_YOUR_WRITES_URL = os.getenv("READ_YOUR_WRITES_URL", "redis://localhost:6379/0")
+
+class PrimaryPinStore:
+    """read-your-writes 고정 저장소 인터페이스"""
+
+    async def pin(self, keys: Iterable, seconds: float):
+        """keys 의 읽기를 seconds 초 동안 기본 DB 로 고정"""
+        raise NotImplementedError
+
+    async def is_pinned(self, key) -> bool:
+        raise NotImplementedError
+
+class MemoryPrimaryPinStore(PrimaryPinStore):
+    """같은 프로세스에서 처리하는 읽기에만 적용"""
+
+    def __init__(self):
+        self._pins: Dict[object, float] = {}  # key -> 기본 DB 로 읽을 기한
+        self._lock = threading.Lock()
+
+    async def pin(self, keys: Iterable, seconds: float):
+        now = time.time()
+        with self._lock:
+            for expired in [key for key, until in self._pins.items() if until <= now]:
+                del self._pins[expired]
+            for key in keys:
+                self._pins[key] = now + seconds
+
+    async def is_pinned(self, key) -> bool:
+        return self._pins.get(key, 0) > time.time()
+
+class RedisPrimaryPinStore(PrimaryPinStore):
+    """Redis 키 - 어느 워커에서 쓰기를 해도 모든 워커의 읽기에 적용"""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+        self._redis = redis.from_url(url)
+
+    @staticmethod
+    def _key(key) -> str:
+        return f"primary_pin:{key}"
+
+    async def pin(self, keys: Iterable, seconds: float):
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(self._key(key), 1, px=max(int(seconds * 1000), 1))
+            await pipe.execute()
+
+    async def is_pinned(self, key) -> bool:
+        return bool(await self._redis.exists(self._key(key)))
+
+_store = None
+
+def get_primary_pin_store() -> PrimaryPinStore:
+    global _store
+    if _store is None:
+        if READ_YOUR_WRITES_BACKEND == "memory":
+            _store = MemoryPrimaryPinStore()
+        elif READ_YOUR_WRITES_BACKEND == "redis":
+            _store = RedisPrimaryPinStore(READ_YOUR_WRITES_URL)
+        else:
+            raise ValueError(f"지원하지 않는 read-your-writes 저장소입니다: {READ_YOUR_WRITES_BACKEND}")
+    return _store
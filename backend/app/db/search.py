@@ -0,0 +1,92 @@
+"""
+멘토 전문 검색 인덱스
+
+mentor_search 테이블에 멘토별 검색 문서(이름, 소개, 스킬)를 두고 역색인으로 검색한다.
+- SQLite: FTS5 가상 테이블 (rowid = users.id), bm25() 로 관련도 정렬
+- PostgreSQL: tsvector 컬럼 + GIN 인덱스, ts_rank_cd() 로 관련도 정렬
+ORM 모델로 표현할 수 없어 테이블은 마이그레이션에서 만들고, 내용은 CRUD 에서 프로필 변경 시 함께 갱신한다.
+
+rank 는 두 DB 모두 작을수록 관련도가 높도록 맞춘다 (오름차순 키셋 페이지네이션용).
+"""
+import re
+from typing import List, Optional
+from sqlalchemy import text, Integer, Float
+
+# 스킬 > 이름 > 소개 순으로 가중치
+SQLITE_BM25_WEIGHTS = "2.0, 1.0, 3.0"  # name, bio, skills
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS mentor_search USING fts5("
+    "name, bio, skills, tokenize='unicode61 remove_diacritics 2')",
+]
+
+POSTGRES_DDL = [
+    "CREATE TABLE IF NOT EXISTS mentor_search ("
+    "user_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE, "
+    "document TSVECTOR NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS ix_mentor_search_document ON mentor_search USING GIN (document)",
+]
+
+POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('simple', :name), 'B') || "
+    "setweight(to_tsvector('simple', :bio), 'C') || "
+    "setweight(to_tsvector('simple', :skills), 'A')"
+)
+
+def _dialect_name(bind) -> str:
+    """Connection 또는 Session 의 DB 종류"""
+    dialect = getattr(bind, "dialect", None)
+    if dialect is None:
+        dialect = bind.get_bind().dialect
+    return dialect.name
+
+def create_search_index(conn):
+    statements = SQLITE_DDL if _dialect_name(conn) == "sqlite" else POSTGRES_DDL
+    for statement in statements:
+        conn.execute(text(statement))
+
+def search_terms(q: Optional[str]) -> List[str]:
+    """검색어에서 단어만 추출 (FTS 문법 문자는 버림)"""
+    return list(dict.fromkeys(term.lower() for term in re.findall(r"\w+", q or "")))
+
+def sync_mentor_document(bind, user_id: int, name: Optional[str], bio: Optional[str], skills: Optional[List[str]]):
+    """멘토 한 명의 검색 문서를 현재 프로필로 교체 (커밋은 호출자가 수행)"""
+    params = {
+        "user_id": user_id,
+        "name": name or "",
+        "bio": bio or "",
+        "skills": " ".join(skills or []),
+    }
+    if _dialect_name(bind) == "sqlite":
+        bind.execute(text("DELETE FROM mentor_search WHERE rowid = :user_id"), params)
+        bind.execute(
+            text("INSERT INTO mentor_search (rowid, name, bio, skills) VALUES (:user_id, :name, :bio, :skills)"),
+            params
+        )
+    else:
+        bind.execute(
+            text(
+                f"INSERT INTO mentor_search (user_id, document) VALUES (:user_id, {POSTGRES_DOCUMENT}) "
+                f"ON CONFLICT (user_id) DO UPDATE SET document = EXCLUDED.document"
+            ),
+            params
+        )
+
+def mentor_search_subquery(bind, terms: List[str]):
+    """
+    검색어와 일치하는 멘토의 (user_id, rank) 서브쿼리
+
+    단어마다 접두어 검색을 하고 OR 로 묶는다. 더 많은 단어가 일치할수록 rank 가 좋아진다.
+    """
+    if _dialect_name(bind) == "sqlite":
+        statement = text(
+            f"SELECT rowid AS user_id, bm25(mentor_search, {SQLITE_BM25_WEIGHTS}) AS rank "
+            f"FROM mentor_search WHERE mentor_search MATCH :query"
+        ).bindparams(query=" OR ".join(f'"{term}"*' for term in terms))
+    else:
+        statement = text(
+            "SELECT user_id, -ts_rank_cd(document, to_tsquery('simple', :query)) AS rank "
+            "FROM mentor_search WHERE document @@ to_tsquery('simple', :query)"
+        ).bindparams(query=" | ".join(f"{term}:*" for term in terms))
+
+    return statement.columns(user_id=Integer, rank=Float).subquery("mentor_search_hits")
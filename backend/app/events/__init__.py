@@ -0,0 +1,152 @@
+"""
+실시간 이벤트 발행/구독
+
+매칭 요청 상태가 바뀌면 관련된 멘토/멘티의 사용자 채널로 이벤트를 발행하고,
+/api/events 스트림이 자신의 채널을 구독해 클라이언트로 전달한다.
+EVENT_BROKER_BACKEND 로 구현을 선택한다.
+- memory: 프로세스 내 큐 (단일 워커)
+- redis: Redis pub/sub (여러 워커/서버, requirements-redis.txt 필요)
+"""
+import asyncio
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+EVENT_BROKER_BACKEND = os.getenv("EVENT_BROKER_BACKEND", "memory")
+EVENT_BROKER_URL = os.getenv("EVENT_BROKER_URL", "redis://localhost:6379/0")
+# 구독자별 대기 이벤트 수 (넘치면 쌓인 이벤트를 버리고 resync 이벤트 전달)
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "100"))
+
+# 구독자가 밀린 이벤트를 잃었으니 변경분 조회(updatedSince)로 다시 맞추라는 신호
+RESYNC_EVENT = {"type": "resync"}
+
+def user_channel(user_id: int) -> str:
+    return f"user:{user_id}"
+
+class Subscription:
+    async def get(self, timeout: float) -> Optional[dict]:
+        """다음 이벤트 (timeout 초 안에 없으면 None)"""
+        raise NotImplementedError
+
+class EventBroker:
+    """이벤트 브로커 인터페이스"""
+
+    async def publish(self, channel: str, event: dict):
+        raise NotImplementedError
+
+    def subscribe(self, channel: str):
+        """async with broker.subscribe(channel) as subscription: ..."""
+        raise NotImplementedError
+
+class MemorySubscription(Subscription):
+    def __init__(self):
+        self.queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+
+    def put(self, event: dict):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 느린 구독자 때문에 발행자가 막히지 않도록 밀린 이벤트는 버림
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+class MemoryEventBroker(EventBroker):
+    """같은 프로세스(이벤트 루프) 안의 구독자에게만 전달"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[MemorySubscription]] = {}
+
+    async def publish(self, channel: str, event: dict):
+        for subscription in list(self._subscribers.get(channel, ())):
+            subscription.put(event)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[MemorySubscription]:
+        subscription = MemorySubscription()
+        self._subscribers.setdefault(channel, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+class RedisSubscription(Subscription):
+    def __init__(self, pubsub):
+        self.pubsub = pubsub
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if message is None:
+            return None
+        return json.loads(message["data"])
+
+class RedisEventBroker(EventBroker):
+    """Redis pub/sub - 어느 워커에서 발행해도 모든 워커의 구독자에게 전달"""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+        self._redis = redis.from_url(url)
+
+    async def publish(self, channel: str, event: dict):
+        await self._redis.publish(channel, json.dumps(event, separators=(",", ":")))
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[RedisSubscription]:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            yield RedisSubscription(pubsub)
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+
+_broker: Optional[EventBroker] = None
+
+def get_event_broker() -> EventBroker:
+    global _broker
+    if _broker is None:
+        if EVENT_BROKER_BACKEND == "memory":
+            _broker = MemoryEventBroker()
+        elif EVENT_BROKER_BACKEND == "redis":
+            _broker = RedisEventBroker(EVENT_BROKER_URL)
+        else:
+            raise ValueError(f"지원하지 않는 이벤트 브로커입니다: {EVENT_BROKER_BACKEND}")
+    return _broker
+
+async def publish_match_request_changes(changes: Iterable[tuple]):
+    """
+    변경된 매칭 요청 (id, mentor_id, mentee_id, status) 을 멘토/멘티 채널로 발행
+
+    DB 커밋 이후에 호출되므로 발행 실패는 요청을 실패시키지 않고 기록만 한다.
+    (구독자는 재연결 시 updatedSince 조회로 놓친 변경을 복구)
+    """
+    broker = get_event_broker()
+    for request_id, mentor_id, mentee_id, status in changes:
+        event = {
+            "type": "match_request",
+            "request": {
+                "id": request_id,
+                "mentorId": mentor_id,
+                "menteeId": mentee_id,
+                "status": status,
+            },
+        }
+        for user_id in (mentor_id, mentee_id):
+            try:
+                await broker.publish(user_channel(user_id), event)
+            except Exception:
+                logger.exception("매칭 요청 이벤트 발행 실패: request_id=%s", request_id)
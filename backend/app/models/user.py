@@ -1,10 +1,21 @@
-from sqlalchemy import Column, Integer, String, Text, LargeBinary, DateTime, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, LargeBinary, DateTime, ForeignKey, JSON, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from app.db.database import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # 멘토 목록 키셋 페이지네이션용 (role 필터 + 정렬 키)
+        Index("ix_users_role_id", "role", "id"),
+        Index("ix_users_role_name_id", "role", "name", "id"),
+        # 스킬순 정렬 (order_by=skill) 키셋 페이지네이션
+        Index("ix_users_role_skill_name_id", "role", "skill_sort_key", "name", "id"),
+        # 매칭 가능한 멘토 필터 (available) + 덜 바쁜 순 정렬 (sort=least_busy)
+        Index("ix_users_role_accepted_pending_id", "role", "accepted_request_count", "pending_request_count", "id"),
+        Index("ix_users_role_pending_id", "role", "pending_request_count", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -12,17 +23,57 @@ class User(Base):
     name = Column(String, nullable=False)
     role = Column(String, nullable=False)  # "mentor" or "mentee"
     bio = Column(Text)
-    profile_image = Column(LargeBinary)  # 이미지 데이터를 바이너리로 저장
-    skills = Column(JSON)  # 멘토의 기술 스택 (JSON 배열)
+    profile_image = deferred(Column(LargeBinary))  # 레거시: 이미지 저장소로 옮기기 전의 바이너리 (마이그레이션 후 NULL)
+    image_hash = Column(String(64))  # 이미지 저장소의 SHA-256 키
+    image_mime = Column(String)
+    image_updated_at = Column(DateTime(timezone=True))  # 이미지 Last-Modified
+    skills = Column(JSON().with_variant(JSONB(), "postgresql"))  # 멘토의 기술 스택 (JSON 배열, PostgreSQL 은 JSONB)
+    skill_sort_key = Column(String, nullable=False, default="", server_default="")  # 정규화된 대표 스킬 (app.core.directory.skill_sort_key)
+    # 멘토가 받은 요청 중 pending/accepted 개수 (요청 상태 변경과 같은 트랜잭션에서 갱신하는 비정규화 값)
+    pending_request_count = Column(Integer, nullable=False, default=0, server_default="0")
+    accepted_request_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # 관계 설정 개선
     sent_requests = relationship("MatchRequest", foreign_keys="MatchRequest.mentee_id", back_populates="mentee", cascade="all, delete-orphan")
     received_requests = relationship("MatchRequest", foreign_keys="MatchRequest.mentor_id", back_populates="mentor", cascade="all, delete-orphan")
+    skill_entries = relationship("MentorSkill", back_populates="user", cascade="all, delete-orphan")
+
+class MentorSkill(Base):
+    """멘토 스킬 정규화 테이블 (users.skills JSON 의 인덱스용 사본)"""
+    __tablename__ = "mentor_skills"
+    __table_args__ = (
+        # 스킬 -> 멘토 조회용 복합 인덱스
+        Index("ix_mentor_skills_skill_user_id", "skill", "user_id"),
+    )
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String, primary_key=True)
+    
+    user = relationship("User", back_populates="skill_entries")
 
 class MatchRequest(Base):
     __tablename__ = "match_requests"
+    __table_args__ = (
+        # 멘티별 요청 (보낸 요청 목록, pending 중복 확인)
+        Index("ix_match_requests_mentee_status", "mentee_id", "status"),
+        # 멘토별 요청 (받은 요청 목록, 수락 시 다른 pending 일괄 거절)
+        Index("ix_match_requests_mentor_status", "mentor_id", "status"),
+        # 받은/보낸 요청 피드 (최신순 키셋 페이지네이션)
+        Index("ix_match_requests_mentor_created", "mentor_id", "created_at", "id"),
+        Index("ix_match_requests_mentee_created", "mentee_id", "created_at", "id"),
+        # 마지막 조회 이후 변경분 조회 (updatedSince)
+        Index("ix_match_requests_mentor_updated", "mentor_id", "updated_at"),
+        Index("ix_match_requests_mentee_updated", "mentee_id", "updated_at"),
+        # 멘티당 pending 요청은 하나만 (부분 유니크 인덱스)
+        Index(
+            "uq_match_requests_mentee_pending", "mentee_id",
+            unique=True,
+            sqlite_where=text("status = 'pending'"),
+            postgresql_where=text("status = 'pending'")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     mentor_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -30,7 +81,7 @@ class MatchRequest(Base):
     message = Column(Text, nullable=False)
     status = Column(String, default="pending")  # "pending", "accepted", "rejected", "cancelled"
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # 관계 설정 개선
     mentor = relationship("User", foreign_keys=[mentor_id], back_populates="received_requests")
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+from datetime import datetime
 from typing import Literal, Optional, List
 
 # 기본 스키마
@@ -30,6 +31,11 @@ class LoginRequest(BaseModel):
 class LoginResponse(BaseModel):
     token: str
 
+# 이벤트 스트림 연결 티켓 (GET /api/events?ticket=)
+class StreamTicketResponse(BaseModel):
+    ticket: str
+    expiresIn: int
+
 # 프로필 스키마
 class MentorProfileDetails(BaseModel):
     name: str
@@ -69,6 +75,13 @@ class UpdateMenteeProfileRequest(BaseModel):
     bio: str
     image: str  # Base64 encoded string
 
+# 여러 사용자 일괄 조회/요청 상대방 정보용 최소 프로필
+class UserSummary(BaseModel):
+    id: int
+    name: str
+    role: Literal["mentor", "mentee"]
+    imageUrl: str
+
 # 멘토 리스트 스키마
 class MentorListItem(BaseModel):
     id: int
@@ -76,6 +89,15 @@ class MentorListItem(BaseModel):
     role: Literal["mentor"]
     profile: MentorProfileDetails
 
+class MentorListPage(BaseModel):
+    items: List[MentorListItem]
+    nextCursor: Optional[str] = None
+
+class MentorRecommendation(MentorListItem):
+    score: float
+    matchedSkills: List[str]
+    available: bool
+
 # 매칭 요청 스키마
 class MatchRequestCreate(BaseModel):
     mentorId: int
@@ -95,6 +117,42 @@ class MatchRequestOutgoing(BaseModel):
     menteeId: int
     status: Literal["pending", "accepted", "rejected", "cancelled"]
 
+# 요청 피드 항목 (expand=counterpart 일 때만 counterpart 포함)
+class MatchRequestWithCounterpart(MatchRequest):
+    counterpart: Optional[UserSummary] = None
+
+class MatchRequestOutgoingWithCounterpart(MatchRequestOutgoing):
+    counterpart: Optional[UserSummary] = None
+
+# 매칭 요청 피드 페이지 (asOf 를 다음 조회의 updatedSince 로 사용)
+class MatchRequestPage(BaseModel):
+    items: List[MatchRequestWithCounterpart]
+    nextCursor: Optional[str] = None
+    asOf: datetime
+
+class MatchRequestOutgoingPage(BaseModel):
+    items: List[MatchRequestOutgoingWithCounterpart]
+    nextCursor: Optional[str] = None
+    asOf: datetime
+
+# 매칭 요청 일괄 처리 스키마
+class MatchRequestAction(BaseModel):
+    id: int
+    action: Literal["accept", "reject"]
+
+class MatchRequestBatchRequest(BaseModel):
+    actions: List[MatchRequestAction] = Field(..., min_length=1, max_length=500)
+
+class MatchRequestBatchResult(BaseModel):
+    id: int
+    action: Literal["accept", "reject"]
+    success: bool
+    status: Optional[Literal["pending", "accepted", "rejected", "cancelled"]] = None
+    error: Optional[str] = None
+
+class MatchRequestBatchResponse(BaseModel):
+    results: List[MatchRequestBatchResult]
+
 # 에러 응답 스키마 - API 명세와 일치하도록 수정
 class ErrorResponse(BaseModel):
     error: str
@@ -0,0 +1,107 @@
+"""
+프로필 이미지 저장소
+
+이미지는 SHA-256 내용 해시를 키로 저장하고 users 테이블에는 해시와 MIME 타입만 기록한다.
+같은 이미지는 한 번만 저장되며, 저장된 파일은 내용이 바뀌지 않는다.
+백엔드는 IMAGE_STORAGE_BACKEND 환경변수로 선택한다 (현재 "local" 만 지원).
+"""
+import hashlib
+import os
+import tempfile
+from typing import Optional
+
+IMAGE_STORAGE_BACKEND = os.getenv("IMAGE_STORAGE_BACKEND", "local")
+IMAGE_STORAGE_DIR = os.getenv("IMAGE_STORAGE_DIR", "./profile_images")
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def detect_image_mime(data: bytes) -> str:
+    """매직 바이트로 이미지 MIME 타입 감지"""
+    if data.startswith(b'\x89PNG'):
+        return "image/png"
+    return "image/jpeg"  # 기본값
+
+class ImageStorage:
+    """이미지 저장소 인터페이스 (S3 호환 백엔드 등은 이 클래스를 구현)"""
+
+    def put(self, key: str, data: bytes) -> None:
+        raise NotImplementedError
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def local_path(self, key: str) -> Optional[str]:
+        """sendfile 로 바로 전송할 수 있는 로컬 파일 경로 (없으면 None)"""
+        return None
+
+    def save(self, data: bytes) -> str:
+        """내용 해시를 키로 저장하고 해시를 반환"""
+        key = content_hash(data)
+        if not self.exists(key):
+            self.put(key, data)
+        return key
+
+class LocalImageStorage(ImageStorage):
+    """로컬 파일시스템 저장소 - root/ab/cd/<hash> 형태로 분산 저장"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        if not key or os.sep in key or "/" in key or key.startswith("."):
+            raise ValueError("잘못된 이미지 키입니다")
+        return os.path.join(self.root, key[:2], key[2:4], key)
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        # 임시 파일에 쓴 뒤 rename 하여 읽는 쪽이 불완전한 파일을 보지 않도록 함
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def local_path(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        return path if os.path.exists(path) else None
+
+_storage: Optional[ImageStorage] = None
+
+def get_image_storage() -> ImageStorage:
+    global _storage
+    if _storage is None:
+        if IMAGE_STORAGE_BACKEND == "local":
+            _storage = LocalImageStorage(IMAGE_STORAGE_DIR)
+        else:
+            raise ValueError(f"지원하지 않는 이미지 저장소입니다: {IMAGE_STORAGE_BACKEND}")
+    return _storage
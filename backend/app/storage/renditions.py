@@ -0,0 +1,38 @@
+"""
+프로필 이미지 썸네일
+
+업로드 시점에 원본과 함께 작은 크기의 사본을 미리 만들어 둔다.
+썸네일 키는 원본 해시에서 파생되므로 원본과 마찬가지로 내용이 바뀌지 않는다.
+"""
+import io
+from typing import Optional
+from PIL import Image, features
+from app.storage import ImageStorage
+
+RENDITION_SIZES = (64, 128, 256)
+
+# WebP 를 지원하지 않는 Pillow 빌드에서는 JPEG 사용
+if features.check("webp"):
+    RENDITION_FORMAT, RENDITION_MIME, RENDITION_EXT = "WEBP", "image/webp", "webp"
+else:
+    RENDITION_FORMAT, RENDITION_MIME, RENDITION_EXT = "JPEG", "image/jpeg", "jpg"
+
+def rendition_key(image_hash: str, size: int) -> str:
+    return f"{image_hash}-{size}.{RENDITION_EXT}"
+
+def create_renditions(storage: ImageStorage, image_hash: str, image: Image.Image):
+    """원본 이미지로 RENDITION_SIZES 크기의 썸네일을 만들어 저장"""
+    if image.mode not in ("RGB", "RGBA") or RENDITION_FORMAT == "JPEG":
+        image = image.convert("RGB")
+
+    for size in RENDITION_SIZES:
+        key = rendition_key(image_hash, size)
+        if storage.exists(key):
+            continue
+        buffer = io.BytesIO()
+        image.resize((size, size), Image.LANCZOS).save(buffer, RENDITION_FORMAT, quality=80)
+        storage.put(key, buffer.getvalue())
+
+def create_renditions_from_bytes(storage: ImageStorage, image_hash: str, data: Optional[bytes]):
+    if data:
+        create_renditions(storage, image_hash, Image.open(io.BytesIO(data)))
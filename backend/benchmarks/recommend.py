@@ -0,0 +1,75 @@
+"""
+멘토 추천 벤치마크
+
+가상의 멘토 N 명으로 app.core.recommend.SkillMatrix 를 만들고
+비트셋 + popcount 순위 계산과 멘토마다 set 교집합을 구하는 파이썬 반복문을 비교한다.
+
+실행: python -m benchmarks.recommend [--mentors 100000] [--skills 500] [--queries 200] [--k 10]
+"""
+import argparse
+import random
+import time
+from app.core.recommend import SkillMatrix, RECOMMEND_AVAILABILITY_WEIGHT
+
+def _naive_top_k(mentors, unavailable_ids, skills, k):
+    query = set(skills)
+    scored = [
+        (len(query & set(mentor_skills)) + RECOMMEND_AVAILABILITY_WEIGHT * (mentor_id not in unavailable_ids), mentor_id)
+        for mentor_id, mentor_skills in mentors
+    ]
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [(mentor_id, score) for score, mentor_id in scored[:k]]
+
+def _timings(fn, queries):
+    elapsed = []
+    for query in queries:
+        started = time.perf_counter()
+        fn(query)
+        elapsed.append(time.perf_counter() - started)
+    elapsed.sort()
+    mean = sum(elapsed) / len(elapsed)
+    p95 = elapsed[int(len(elapsed) * 0.95) - 1]
+    return mean * 1000, p95 * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mentors", type=int, default=100000)
+    parser.add_argument("--skills", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = [f"skill-{n}" for n in range(args.skills)]
+    mentors = [(mentor_id, rng.sample(vocabulary, rng.randint(1, 8))) for mentor_id in range(1, args.mentors + 1)]
+    unavailable_ids = {mentor_id for mentor_id, _ in mentors if rng.random() < 0.3}
+    queries = [rng.sample(vocabulary, rng.randint(1, 5)) for _ in range(args.queries)]
+
+    started = time.perf_counter()
+    matrix = SkillMatrix.build(mentors, unavailable_ids)
+    build = time.perf_counter() - started
+
+    # 두 방식의 결과가 같은지 먼저 확인
+    for query in queries[:10]:
+        expected = _naive_top_k(mentors, unavailable_ids, query, args.k)
+        actual = [(mentor_id, score) for mentor_id, score, _ in matrix.top_k(query, args.k, RECOMMEND_AVAILABILITY_WEIGHT)]
+        assert actual == expected, (query, actual, expected)
+
+    started = time.perf_counter()
+    for mentor_id, mentor_skills in rng.sample(mentors, 1000):
+        matrix.upsert(mentor_id, mentor_skills[1:] + [rng.choice(vocabulary)])
+    upsert = (time.perf_counter() - started) / 1000
+
+    print(f"mentors={args.mentors} skills={args.skills} queries={args.queries} k={args.k}")
+    print(f"  build: {build * 1000:>10.1f} ms")
+    print(f" upsert: {upsert * 1000000:>10.1f} us/mentor")
+    for name, fn in (
+        ("bitset", lambda query: matrix.top_k(query, args.k, RECOMMEND_AVAILABILITY_WEIGHT)),
+        ("python", lambda query: _naive_top_k(mentors, unavailable_ids, query, args.k)),
+    ):
+        mean, p95 = _timings(fn, queries)
+        print(f"{name:>7}: {mean:>10.2f} ms/query (p95 {p95:.2f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,11 @@ from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.db.database import engine
-from app.models.user import Base
-from app.api import auth, profile, mentors
+from app.db.migrations import run_migrations
+from app.api import auth, profile, mentors, metrics, events
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+# 데이터베이스 테이블 생성 및 마이그레이션 (여러 워커가 동시에 시작해도 한 번만 적용)
+run_migrations(engine)
 
 app = FastAPI(
     title="Mentor-Mentee Matching API",
@@ -50,6 +50,8 @@ async def read_root():
 app.include_router(auth.router, prefix="/api", tags=["Authentication"])
 app.include_router(profile.router, prefix="/api", tags=["User Profile"])
 app.include_router(mentors.router, prefix="/api", tags=["Mentors", "Match Requests"])
+app.include_router(metrics.router, prefix="/api", tags=["Metrics"])
+app.include_router(events.router, prefix="/api", tags=["Events"])
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,99 @@
+"""
+빈 DB 에서 마이그레이션 -> 전문 검색 -> 매칭 요청 생성까지의 스모크 테스트
+
+TEST_DATABASE_URL 로 PostgreSQL 을 지정하면 DB 별로 갈리는 코드
+(advisory lock 마이그레이션, tsvector/GIN 검색 인덱스, INSERT ... SELECT ... RETURNING)가 실행된다.
+"""
+import threading
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import sessionmaker
+from app import crud
+from app.db.migrations import MIGRATIONS, run_migrations
+from app.models.user import User
+from app.schemas.user import SignupRequest, UpdateMentorProfileRequest, MatchRequestCreate
+from conftest import is_memory_database
+
+ALL_VERSIONS = {version for version, _, _ in MIGRATIONS}
+
+def applied_versions(engine):
+    with engine.connect() as conn:
+        return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+@pytest.fixture
+def migrated(make_engine):
+    engine = make_engine()
+    run_migrations(engine)
+    return engine
+
+@pytest.fixture
+def session(migrated):
+    session = sessionmaker(bind=migrated, autoflush=False)()
+    yield session
+    session.close()
+
+def test_migrations_create_schema_once(migrated):
+    assert applied_versions(migrated) == ALL_VERSIONS
+    tables = set(inspect(migrated).get_table_names())
+    assert {"users", "mentor_skills", "match_requests", "mentor_search", "schema_migrations"} <= tables
+
+    # 다시 실행해도 아무것도 바뀌지 않음
+    run_migrations(migrated)
+    assert applied_versions(migrated) == ALL_VERSIONS
+
+@pytest.mark.skipif(is_memory_database(), reason="메모리 SQLite 는 엔진마다 별개의 DB")
+def test_concurrent_migrations(make_engine):
+    engines = [make_engine() for _ in range(4)]
+    barrier = threading.Barrier(len(engines))
+    errors = []
+
+    def migrate(engine):
+        barrier.wait()
+        try:
+            run_migrations(engine)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=migrate, args=(engine,)) for engine in engines]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert applied_versions(engines[0]) == ALL_VERSIONS
+
+def signup(session, email, role):
+    return crud.create_user(session, SignupRequest(email=email, password="password", name=email, role=role), "x")
+
+def test_search_and_create_request(session):
+    mentor = signup(session, "mentor@example.com", "mentor")
+    other = signup(session, "other@example.com", "mentor")
+    mentee = signup(session, "mentee@example.com", "mentee")
+    crud.update_user_profile(session, mentor, UpdateMentorProfileRequest(
+        id=mentor.id, name="Kim", role="mentor", bio="frontend developer", image="", skills=["React", "TypeScript"]
+    ))
+
+    # 전문 검색 (접두어 일치, 관련도 순)
+    assert [found.id for found in crud.get_mentors(session, q="react")] == [mentor.id]
+    assert [found.id for found in crud.get_mentors(session, q="front")] == [mentor.id]
+    mentors, _ = crud.get_mentors_page(session, q="typescript kim", limit=1)
+    assert [found.id for found in mentors] == [mentor.id]
+    assert crud.get_mentors(session, q="python") == []
+
+    # 멘토/멘티 확인과 생성을 한 문장으로 처리하고 생성된 행을 RETURNING 으로 받음
+    request = crud.create_match_request(
+        session, MatchRequestCreate(mentorId=mentor.id, menteeId=mentee.id, message="hello")
+    )
+    assert (request.mentor_id, request.mentee_id, request.status) == (mentor.id, mentee.id, "pending")
+    assert session.get(User, mentor.id).pending_request_count == 1
+
+    # 멘티당 pending 요청은 하나
+    with pytest.raises(ValueError):
+        crud.create_match_request(session, MatchRequestCreate(mentorId=other.id, menteeId=mentee.id, message="hello"))
+
+    # 생성하지 못하면 없는 쪽을 사유로 알려줌
+    with pytest.raises(ValueError, match="^멘토를 찾을 수 없습니다$"):
+        crud.create_match_request(session, MatchRequestCreate(mentorId=mentee.id, menteeId=mentee.id, message="hello"))
+    with pytest.raises(ValueError, match="^멘티를 찾을 수 없습니다$"):
+        crud.create_match_request(session, MatchRequestCreate(mentorId=mentor.id, menteeId=other.id, message="hello"))
@@ -0,0 +1,65 @@
+"""
+이벤트 스트림 인증 테스트
+
+URL 로 전달되는 연결 티켓은 스트림 연결에만, 한 번만 쓸 수 있고,
+연결 후 로그아웃하면 다음 하트비트에서 스트림이 닫히는지 확인한다.
+"""
+import asyncio
+import pytest
+from fastapi import HTTPException
+from app.api import events
+from app.auth import Principal, payload_from_stream_ticket, payload_from_token
+from app.core import revocation
+from app.core.security import create_access_token, create_stream_ticket, revoke_token, verify_token
+
+@pytest.fixture(autouse=True)
+def revocation_store(monkeypatch):
+    monkeypatch.setattr(revocation, "_store", revocation.MemoryRevocationStore())
+
+@pytest.fixture
+def access_payload():
+    token = create_access_token({"user_id": 1, "email": "mentee@example.com", "name": "mentee", "role": "mentee"})
+    return asyncio.run(payload_from_token(token))
+
+def assert_unauthorized(coroutine):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(coroutine)
+    assert error.value.status_code == 401
+
+def test_ticket_is_single_use_and_stream_only(access_payload):
+    ticket = create_stream_ticket(access_payload)
+    # 티켓은 일반 API 의 액세스 토큰으로 쓸 수 없음
+    assert verify_token(ticket) is None
+
+    payload = asyncio.run(payload_from_stream_ticket(ticket))
+    assert (payload["user_id"], payload["jti"], payload["exp"]) == (1, access_payload["jti"], access_payload["exp"])
+    assert "email" not in payload
+    assert_unauthorized(payload_from_stream_ticket(ticket))
+
+def test_ticket_rejected_after_logout(access_payload):
+    ticket = create_stream_ticket(access_payload)
+    asyncio.run(revoke_token(access_payload))
+    assert_unauthorized(payload_from_stream_ticket(ticket))
+
+class ConnectedRequest:
+    async def is_disconnected(self):
+        return False
+
+def test_stream_closes_after_logout(access_payload, monkeypatch):
+    monkeypatch.setattr(events, "EVENT_HEARTBEAT_SECONDS", 0.01)
+    principal = Principal(id=1, email="mentee@example.com", name="mentee", role="mentee", jti=access_payload["jti"])
+
+    async def read_stream():
+        response = await events.stream_events(ConnectedRequest(), principal, access_payload)
+        stream = response.body_iterator
+        chunks = [await stream.__anext__() for _ in range(3)]
+        await revoke_token(access_payload)
+        chunks.append(await stream.__anext__())
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+        return chunks
+
+    chunks = asyncio.run(read_stream())
+    assert chunks[1].startswith("event: ready")
+    assert chunks[2] == ": ping\n\n"
+    assert chunks[3] == "event: revoked\ndata: {}\n\n"
@@ -0,0 +1,59 @@
+"""
+매칭 요청 피드의 asOf / updatedSince 변경분 조회 테스트
+
+asOf 이전 시각으로 기록되었지만 응답 뒤에 커밋(또는 복제)된 변경이
+다음 updatedSince=asOf 조회에서 빠지지 않는지 확인한다.
+"""
+from datetime import timedelta, timezone
+from sqlalchemy import select, func, update
+from app import crud
+from app.models.user import MatchRequest
+
+OVERLAP_SECONDS = 30
+
+def database_now(db):
+    now = db.execute(select(func.now())).scalar()
+    return now if now.tzinfo is not None else now.replace(tzinfo=timezone.utc)
+
+def set_updated_at(db, request_id, updated_at):
+    db.execute(
+        update(MatchRequest)
+        .where(MatchRequest.id == request_id)
+        .values(updated_at=updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+def test_as_of_is_behind_database_clock(db):
+    now = database_now(db)
+    as_of = crud.get_match_request_feed_as_of(db, OVERLAP_SECONDS)
+    assert as_of.tzinfo is not None
+    assert now - timedelta(seconds=OVERLAP_SECONDS + 1) <= as_of <= now - timedelta(seconds=OVERLAP_SECONDS)
+
+def test_change_committed_after_response_is_delivered_next_poll(db, users, create_request):
+    mentor_id, mentee_ids = users
+    first = create_request(mentor_id, mentee_ids[0])
+
+    # 첫 조회 - 이 시점에는 두 번째 요청이 아직 보이지 않음 (복제 전이거나 커밋 전)
+    requests, _ = crud.get_incoming_match_requests_page(db, mentor_id)
+    as_of = crud.get_match_request_feed_as_of(db, OVERLAP_SECONDS)
+    assert [request.id for request in requests] == [first.id]
+
+    # 응답 직전 시각으로 기록된 변경이 응답 뒤에 나타남
+    late = create_request(mentor_id, mentee_ids[1])
+    set_updated_at(db, late.id, database_now(db) - timedelta(seconds=1))
+
+    requests, _ = crud.get_incoming_match_requests_page(db, mentor_id, updated_since=as_of)
+    assert late.id in [request.id for request in requests]
+
+    requests, _ = crud.get_outgoing_match_requests_page(db, mentee_ids[1], updated_since=as_of)
+    assert [request.id for request in requests] == [late.id]
+
+def test_updated_since_excludes_changes_before_overlap(db, users, create_request):
+    mentor_id, mentee_ids = users
+    old = create_request(mentor_id, mentee_ids[0])
+    set_updated_at(db, old.id, database_now(db) - timedelta(seconds=OVERLAP_SECONDS * 2))
+
+    as_of = crud.get_match_request_feed_as_of(db, OVERLAP_SECONDS)
+    requests, _ = crud.get_incoming_match_requests_page(db, mentor_id, updated_since=as_of)
+    assert old.id not in [request.id for request in requests]
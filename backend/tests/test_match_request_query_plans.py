@@ -0,0 +1,112 @@
+"""
+match_requests 핫 쿼리의 실행 계획 테스트
+
+테스트 DB 에 모델 스키마를 만들고 실제 CRUD 함수가 보내는 SQL 을 가로채
+실행 계획에서 match_requests 를 인덱스 없이 전체 스캔하지 않는지 확인한다.
+- SQLite: EXPLAIN QUERY PLAN 의 "SCAN match_requests"
+- PostgreSQL: enable_seqscan 을 끈 EXPLAIN 의 "Seq Scan on match_requests"
+  (작은 테이블은 원래 순차 스캔이 싸므로, 쓸 수 있는 인덱스가 없을 때만 순차 스캔이 남음)
+"""
+import re
+import pytest
+from sqlalchemy import event, select, literal_column
+from app import crud
+from app.models.user import MatchRequest
+
+# 인덱스 없이 테이블 전체를 읽는 계획 (SEARCH ... USING INDEX / Index Scan 은 통과)
+FULL_SCANS = {
+    "sqlite": re.compile(r"\bSCAN match_requests\b(?! USING)"),
+    "postgresql": re.compile(r"\bSeq Scan on match_requests\b"),
+}
+
+@pytest.fixture
+def captured(engine):
+    """실행된 SQL 중 match_requests 를 조건으로 읽거나 바꾸는 문장 (statement, parameters)"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if executemany or statement.startswith(("EXPLAIN", "SET")):
+            return
+        if "match_requests" in statement and "WHERE" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+def query_plan(engine, statement, parameters=()):
+    """드라이버 SQL 문장의 실행 계획 (한 줄씩)"""
+    with engine.connect() as conn:
+        if conn.dialect.name == "sqlite":
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            return [row[-1] for row in rows]
+        # 트랜잭션 안에서만 적용 (연결이 닫힐 때 롤백)
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        return [row[0] for row in conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()]
+
+def assert_uses_index(engine, statements):
+    assert statements
+    full_scan = FULL_SCANS[engine.dialect.name]
+    for statement, parameters in list(statements):
+        plan = query_plan(engine, statement, parameters)
+        scans = [line for line in plan if full_scan.search(line)]
+        assert not scans, f"전체 스캔: {statement}\n{plan}"
+
+def test_pending_check_uses_partial_unique_index(engine, db, users, captured, create_request):
+    mentor_id, mentee_ids = users
+    db.execute(
+        select(MatchRequest.id)
+        .where(MatchRequest.mentee_id == mentee_ids[0], MatchRequest.status == literal_column("'pending'"))
+    )
+    [(statement, parameters)] = captured
+    plan = query_plan(engine, statement, parameters)
+    assert any(
+        "uq_match_requests_mentee_pending" in line or "ix_match_requests_mentee_status" in line
+        for line in plan
+    ), plan
+
+    # 멘티당 pending 요청은 유니크 인덱스가 하나로 제한
+    create_request(mentor_id, mentee_ids[0])
+    with pytest.raises(ValueError):
+        create_request(mentor_id, mentee_ids[0])
+
+def test_accept_bulk_reject_uses_index(engine, db, users, captured, create_request):
+    mentor_id, mentee_ids = users
+    requests = [create_request(mentor_id, mentee_id) for mentee_id in mentee_ids]
+    captured.clear()
+
+    crud.accept_match_request(db, requests[0].id, mentor_id)
+
+    bulk_reject = [
+        (statement, parameters) for statement, parameters in captured
+        if statement.startswith("UPDATE match_requests") and "WHERE match_requests.mentor_id" in statement
+    ]
+    assert bulk_reject
+    assert_uses_index(engine, captured)
+    for statement, parameters in list(bulk_reject):
+        assert any("ix_match_requests_mentor_status" in line for line in query_plan(engine, statement, parameters))
+
+def test_cancel_uses_index(engine, db, users, captured, create_request):
+    mentor_id, mentee_ids = users
+    request = create_request(mentor_id, mentee_ids[0])
+    captured.clear()
+
+    crud.cancel_match_request(db, request.id, mentee_ids[0])
+
+    assert_uses_index(engine, captured)
+
+@pytest.mark.parametrize("status", [None, "pending", "pending,accepted"])
+def test_request_feeds_use_index(engine, db, users, captured, status, create_request):
+    mentor_id, mentee_ids = users
+    for mentee_id in mentee_ids:
+        create_request(mentor_id, mentee_id)
+    captured.clear()
+
+    crud.get_incoming_match_requests(db, mentor_id, status=status)
+    crud.get_outgoing_match_requests(db, mentee_ids[0], status=status)
+    _, cursor = crud.get_incoming_match_requests_page(db, mentor_id, status=status, limit=1)
+    crud.get_incoming_match_requests_page(db, mentor_id, status=status, limit=1, cursor=cursor)
+    crud.get_outgoing_match_requests_page(db, mentee_ids[0], status=status, limit=1)
+    crud.get_incoming_match_requests(db, mentor_id, status=status, expand_counterpart=True)
+
+    assert_uses_index(engine, captured)
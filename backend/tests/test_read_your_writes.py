@@ -0,0 +1,57 @@
+"""
+읽기 복제본 read-your-writes 고정 테스트
+
+복제본이 하나 설정된 것처럼 바꿔 두고, 쓰기 후 고정된 사용자의 읽기만 기본 DB 로 가는지 확인한다.
+"""
+import asyncio
+import time
+import pytest
+from app.db import database, primary_pins
+from app.crud import aio as crud_async
+
+class SyncSessionAdapter:
+    """AsyncSession.run_sync 를 테스트 DB 의 동기 세션으로 실행"""
+
+    def __init__(self, session):
+        self.session = session
+        self.info = session.info
+
+    async def run_sync(self, fn, *args):
+        return fn(self.session, *args)
+
+@pytest.fixture
+def replica(monkeypatch):
+    replica = object()
+    monkeypatch.setattr(database, "ReadSessionLocals", [replica])
+    monkeypatch.setattr(database, "READ_REPLICA_STRATEGY", "round_robin")
+    monkeypatch.setattr(primary_pins, "_store", primary_pins.MemoryPrimaryPinStore())
+    return replica
+
+def read_targets(*keys):
+    async def targets():
+        return [await database.read_sessionmaker_for(key) for key in keys]
+    return asyncio.run(targets())
+
+def test_pinned_users_read_primary(replica):
+    assert read_targets(1, None) == [replica, replica]
+
+    asyncio.run(database.pin_primary(1, 2))
+    assert read_targets(1, 2, 3, None) == [database.AsyncSessionLocal, database.AsyncSessionLocal, replica, replica]
+
+def test_pin_expires(replica, monkeypatch):
+    monkeypatch.setattr(database, "READ_YOUR_WRITES_SECONDS", 0.05)
+    asyncio.run(database.pin_primary(1))
+    assert read_targets(1) == [database.AsyncSessionLocal]
+    time.sleep(0.1)
+    assert read_targets(1) == [replica]
+
+def test_match_request_change_pins_both_sides(replica, db, users, create_request):
+    mentor_id, mentee_ids = users
+    accepted = create_request(mentor_id, mentee_ids[0])
+    create_request(mentor_id, mentee_ids[1])
+
+    # 수락한 멘토, 수락된 멘티, 자동 거절된 멘티 모두 고정 (요청이 없는 멘티는 제외)
+    asyncio.run(crud_async.accept_match_request(SyncSessionAdapter(db), accepted.id, mentor_id))
+    assert read_targets(mentor_id, mentee_ids[0], mentee_ids[1], mentee_ids[2]) == [
+        database.AsyncSessionLocal, database.AsyncSessionLocal, database.AsyncSessionLocal, replica
+    ]
@@ -0,0 +1,46 @@
+"""
+VersionedSnapshot 로드 규칙 테스트 (멘토 디렉터리/추천 행렬 공통)
+"""
+import asyncio
+from app.core.snapshot import VersionedSnapshot
+
+class ListSnapshot(VersionedSnapshot[list]):
+    def build(self, source):
+        return list(source)
+
+def test_change_during_load_is_not_kept():
+    snapshot = ListSnapshot(ttl=60)
+
+    async def fetch():
+        # 읽는 도중 다른 요청이 변경을 적용
+        snapshot.apply(lambda value: value + [0])
+        return [1]
+
+    assert asyncio.run(snapshot.get(fetch)) == [1]
+    assert snapshot.latest() is None
+
+    async def fetch_again():
+        return [1, 2]
+
+    assert asyncio.run(snapshot.get(fetch_again)) == [1, 2]
+    snapshot.apply(lambda value: value + [3])
+    assert snapshot.current() == [1, 2, 3]
+
+def test_single_reload_while_others_use_previous(monkeypatch):
+    snapshot = ListSnapshot(ttl=60)
+    fetches = []
+
+    async def fetch():
+        fetches.append(len(fetches))
+        await asyncio.sleep(0.01)
+        return [len(fetches)]
+
+    async def expire_and_read():
+        await snapshot.get(fetch)
+        # TTL 이 지난 상태로 만듦
+        monkeypatch.setattr(snapshot, "_loaded_at", 0.0)
+        return await asyncio.gather(snapshot.get(fetch), snapshot.get(fetch))
+
+    # 다시 읽는 요청은 하나, 다른 요청은 이전 값으로 응답
+    assert sorted(asyncio.run(expire_and_read())) == [[1], [2]]
+    assert len(fetches) == 2